@@ -0,0 +1,85 @@
+import base64
+import json
+from datetime import datetime
+from typing import Literal, get_args
+
+from sqlalchemy import func, select, tuple_
+
+from models import applications
+
+ApplicationStatus = Literal["Applied", "Interview", "Rejected"]
+STATUSES = get_args(ApplicationStatus)
+
+
+def encode_cursor(updated_at: datetime, application_id: int):
+    payload = json.dumps([updated_at.isoformat(), application_id]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """Returns (updated_at, id) from an opaque cursor; raises ValueError if it is malformed."""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        updated_at, application_id = json.loads(payload)
+        return datetime.fromisoformat(updated_at), int(application_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def _filters(user_email: str, company: str | None):
+    conditions = [applications.c.user_email == user_email]
+    if company:
+        conditions.append(applications.c.company == company)
+    return conditions
+
+
+def page_query(user_email: str, status: str | None = None, company: str | None = None,
+               limit: int = 50, cursor: str | None = None):
+    """Newest-first page of applications, continuing after ``cursor`` (keyset, not OFFSET).
+
+    One row more than ``limit`` is fetched to tell whether another page exists.
+    """
+    conditions = _filters(user_email, company)
+    if status:
+        conditions.append(applications.c.status == status)
+    if cursor:
+        conditions.append(
+            tuple_(applications.c.updated_at, applications.c.id) < tuple_(*decode_cursor(cursor))
+        )
+    return (
+        applications.select()
+        .where(*conditions)
+        .order_by(applications.c.updated_at.desc(), applications.c.id.desc())
+        .limit(limit + 1)
+    )
+
+
+def status_counts_query(user_email: str, company: str | None = None):
+    return (
+        select(applications.c.status, func.count().label("count"))
+        .where(*_filters(user_email, company))
+        .group_by(applications.c.status)
+    )
+
+
+def status_update_query(application_id: int, status: str):
+    return (
+        applications.update()
+        .where(applications.c.id == application_id)
+        .values(status=status, updated_at=func.now())
+        .returning(*applications.c)
+    )
+
+
+async def load_dashboard(database, user_email: str, status: str | None = None, company: str | None = None,
+                         limit: int = 50, cursor: str | None = None):
+    rows = await database.fetch_all(page_query(user_email, status, company, limit, cursor))
+    counts = {name: 0 for name in STATUSES}
+    for row in await database.fetch_all(status_counts_query(user_email, company)):
+        counts[row["status"]] = row["count"]
+
+    page = [dict(row._mapping) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(page[-1]["updated_at"], page[-1]["id"])
+    return {"applications": page, "counts": counts, "next_cursor": next_cursor}
@@ -0,0 +1,380 @@
+import abc
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from models import analysis_cache, user_profiles
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_text(text: str):
+    return _WHITESPACE.sub(' ', text or '').strip()
+
+
+def analysis_cache_key(resume_text: str, job_description: str, model: str | None):
+    digest = hashlib.sha256()
+    for part in (model or '', normalize_text(resume_text), normalize_text(job_description)):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class LRUCache:
+    """In-process LRU with a per-entry TTL. Evicts the least recently used entry once full."""
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key onto one in-flight task."""
+
+    def __init__(self):
+        self._calls = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: str, fn):
+        task = self._calls.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.shared += 1
+        # Shielded so one caller disconnecting does not cancel the call for the others
+        return await asyncio.shield(task)
+
+    def stats(self):
+        return {"in_flight": len(self._calls), "calls": self.calls, "shared": self.shared}
+
+
+class AnalysisCache:
+    """Two-tier cache for resume analysis results: in-process LRU, then optionally Postgres.
+
+    Expired rows are deleted from Postgres on write, at most once every ``prune_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        database,
+        max_entries: int = 1024,
+        ttl: float = 86400,
+        persist: bool = False,
+        prune_interval: float = 3600,
+    ):
+        self.database = database
+        self.memory = LRUCache(max_entries=max_entries, ttl=ttl)
+        self.ttl = ttl
+        self.persist = persist
+        self.prune_interval = prune_interval
+        self._pruned_at = None
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.stores = 0
+        self.db_errors = 0
+        self.prunes = 0
+
+    @classmethod
+    def from_env(cls, database):
+        return cls(
+            database,
+            max_entries=int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "1024")),
+            ttl=float(os.getenv("ANALYSIS_CACHE_TTL", "86400")),
+            persist=os.getenv("ANALYSIS_CACHE_PERSIST", "false").lower() in ("1", "true", "yes"),
+            prune_interval=float(os.getenv("ANALYSIS_CACHE_PRUNE_INTERVAL", "3600")),
+        )
+
+    async def get(self, key: str):
+        result = self.memory.get(key)
+        if result is not None:
+            self.memory_hits += 1
+            return result
+
+        if self.persist:
+            result = await self._db_get(key)
+            if result is not None:
+                self.db_hits += 1
+                self.memory.set(key, result)
+                return result
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, result: dict, model: str | None = None):
+        self.stores += 1
+        self.memory.set(key, result)
+        if self.persist:
+            await self._db_set(key, result, model)
+            await self._maybe_prune()
+
+    def record_bypass(self):
+        self.bypasses += 1
+
+    def _cutoff(self):
+        return datetime.now(timezone.utc) - timedelta(seconds=self.ttl)
+
+    async def _db_get(self, key: str):
+        cutoff = self._cutoff()
+        query = analysis_cache.select().where(
+            (analysis_cache.c.key == key) & (analysis_cache.c.created_at >= cutoff)
+        )
+        try:
+            row = await self.database.fetch_one(query)
+        except Exception:
+            self.db_errors += 1
+            return None
+        return json.loads(row["result"]) if row else None
+
+    async def _db_set(self, key: str, result: dict, model: str | None):
+        insert_stmt = pg_insert(analysis_cache).values(
+            key=key,
+            model=model,
+            result=json.dumps(result),
+            created_at=datetime.now(timezone.utc)
+        )
+        update_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=["key"],
+            set_={
+                "model": insert_stmt.excluded.model,
+                "result": insert_stmt.excluded.result,
+                "created_at": insert_stmt.excluded.created_at,
+            }
+        )
+        try:
+            await self.database.execute(update_stmt)
+        except Exception:
+            self.db_errors += 1
+
+    async def _maybe_prune(self):
+        now = time.monotonic()
+        if self._pruned_at is not None and now - self._pruned_at < self.prune_interval:
+            return
+        # Claimed before the await so concurrent writes do not all issue the delete
+        self._pruned_at = now
+        query = analysis_cache.delete().where(analysis_cache.c.created_at < self._cutoff())
+        try:
+            await self.database.execute(query)
+            self.prunes += 1
+        except Exception:
+            self.db_errors += 1
+
+    def stats(self):
+        return {
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "stores": self.stores,
+            "db_errors": self.db_errors,
+            "prunes": self.prunes,
+            "persist": self.persist,
+            "memory": self.memory.stats(),
+        }
+
+
+class SharedCacheBackend(abc.ABC):
+    """Cache shared between processes. Values are JSON strings; failures may raise."""
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> str | None:
+        ...
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: str, ttl: float):
+        ...
+
+    @abc.abstractmethod
+    async def delete(self, key: str):
+        ...
+
+
+class RedisCacheBackend(SharedCacheBackend):
+    """Redis-backed shared cache; needs the optional ``redis`` package."""
+
+    def __init__(self, url: str, prefix: str = "job-assistant:"):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("The redis package is required for a Redis profile cache") from e
+        self.client = redis.from_url(url)
+        self.prefix = prefix
+
+    async def get(self, key: str):
+        value = await self.client.get(self.prefix + key)
+        return value.decode() if value is not None else None
+
+    async def set(self, key: str, value: str, ttl: float):
+        await self.client.set(self.prefix + key, value, px=int(ttl * 1000))
+
+    async def delete(self, key: str):
+        await self.client.delete(self.prefix + key)
+
+
+class ProfileCache:
+    """Read-through cache of user profiles by email: in-process LRU, then an optional shared backend.
+
+    Writers call ``invalidate`` after changing a profile. Entries cached by
+    other processes' LRUs are only dropped when their TTL runs out, so keep
+    the TTL short when running several workers.
+    """
+
+    def __init__(self, database, max_entries: int = 4096, ttl: float = 30, shared: SharedCacheBackend | None = None):
+        self.database = database
+        self.memory = LRUCache(max_entries=max_entries, ttl=ttl)
+        self.ttl = ttl
+        self.shared = shared
+        self.loads = SingleFlight()
+        self.memory_hits = 0
+        self.shared_hits = 0
+        self.db_loads = 0
+        self.invalidations = 0
+        self.shared_errors = 0
+        # Per email, the sequence number of its last invalidation, so a load that raced with a
+        # write does not cache stale data. Bounded like the LRU; emails dropped from it read as
+        # the newest dropped number, which is never older than what a racing load saw.
+        self._generations = OrderedDict()
+        self._sequence = 0
+        self._dropped_generation = 0
+
+    @classmethod
+    def from_env(cls, database):
+        redis_url = os.getenv("PROFILE_CACHE_REDIS_URL")
+        return cls(
+            database,
+            max_entries=int(os.getenv("PROFILE_CACHE_MAX_ENTRIES", "4096")),
+            ttl=float(os.getenv("PROFILE_CACHE_TTL", "30")),
+            shared=RedisCacheBackend(redis_url) if redis_url else None,
+        )
+
+    async def get(self, email: str):
+        """Returns the profile as a dict, or None if there is no such profile."""
+        profile = self.memory.get(email)
+        if profile is not None:
+            self.memory_hits += 1
+            return profile
+        # Concurrent misses for one email share a single lookup
+        return await self.loads.do(f"{self._generation(email)}:{email}", lambda: self._load(email))
+
+    def _generation(self, email: str):
+        return self._generations.get(email, self._dropped_generation)
+
+    def _bump_generation(self, email: str):
+        self._sequence += 1
+        self._generations[email] = self._sequence
+        self._generations.move_to_end(email)
+        if len(self._generations) > self.memory.max_entries:
+            _, dropped = self._generations.popitem(last=False)
+            self._dropped_generation = dropped
+
+    async def _load(self, email: str):
+        generation = self._generation(email)
+        if self.shared is not None:
+            try:
+                value = await self.shared.get("profile:" + email)
+            except Exception:
+                self.shared_errors += 1
+                value = None
+            if value is not None:
+                self.shared_hits += 1
+                profile = json.loads(value)
+                if generation == self._generation(email):
+                    self.memory.set(email, profile)
+                return profile
+
+        self.db_loads += 1
+        row = await self.database.fetch_one(user_profiles.select().where(user_profiles.c.email == email))
+        if row is None:
+            return None
+        profile = dict(row._mapping)
+        if generation != self._generation(email):
+            return profile
+        self.memory.set(email, profile)
+        if self.shared is not None:
+            try:
+                await self.shared.set("profile:" + email, json.dumps(profile), self.ttl)
+            except Exception:
+                self.shared_errors += 1
+        return profile
+
+    async def invalidate(self, email: str):
+        self.invalidations += 1
+        self._bump_generation(email)
+        self.memory.delete(email)
+        if self.shared is not None:
+            try:
+                await self.shared.delete("profile:" + email)
+            except Exception:
+                self.shared_errors += 1
+
+    def stats(self):
+        return {
+            "memory_hits": self.memory_hits,
+            "shared_hits": self.shared_hits,
+            "db_loads": self.db_loads,
+            "invalidations": self.invalidations,
+            "shared_errors": self.shared_errors,
+            "shared": type(self.shared).__name__ if self.shared else None,
+            "memory": self.memory.stats(),
+        }
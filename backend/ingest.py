@@ -0,0 +1,305 @@
+import asyncio
+import hashlib
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from models import resumes, user_profiles
+from backend.pdf_extract import PDFTooLarge, extract_pdf_text
+from backend.resume_parser import parse_resume
+
+MAX_REPORTED_ERRORS = 100
+
+
+def list_pdfs(path: str):
+    """Returns (archive, names): PDF members of a zip file, or PDF paths under a directory."""
+    if os.path.isdir(path):
+        names = []
+        for root, _, files in os.walk(path):
+            names.extend(os.path.join(root, name) for name in files if name.lower().endswith(".pdf"))
+        return None, sorted(names)
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            names = [
+                info.filename for info in archive.infolist()
+                if not info.is_dir()
+                and info.filename.lower().endswith(".pdf")
+                and not info.filename.startswith("__MACOSX/")
+            ]
+        return path, names
+    raise ValueError(f"{path} is neither a directory nor a zip file")
+
+
+def parse_pdf_batch(archive: str | None, names: list[str], max_pages: int, max_bytes: int):
+    """Extracts and parses a batch of PDFs in a worker process; failures are reported per file."""
+    results = []
+    zip_file = zipfile.ZipFile(archive) if archive else None
+    try:
+        for name in names:
+            filename = os.path.basename(name)
+            try:
+                if zip_file:
+                    if zip_file.getinfo(name).file_size > max_bytes:
+                        raise PDFTooLarge(f"PDF is larger than {max_bytes} bytes")
+                    source = zip_file.read(name)
+                else:
+                    if os.path.getsize(name) > max_bytes:
+                        raise PDFTooLarge(f"PDF is larger than {max_bytes} bytes")
+                    source = name
+                text = extract_pdf_text(source, max_pages)
+                results.append({"filename": filename, "text": text, "parsed": parse_resume(text)})
+            except Exception as e:
+                results.append({"filename": filename, "error": f"{type(e).__name__}: {e}"})
+    finally:
+        if zip_file:
+            zip_file.close()
+    return results
+
+
+def profile_upsert(rows: list[dict]):
+    insert_stmt = pg_insert(user_profiles).values(rows)
+    return insert_stmt.on_conflict_do_update(
+        index_elements=["email"],
+        set_={
+            "full_name": insert_stmt.excluded.full_name,
+            "phone": insert_stmt.excluded.phone,
+            "education": insert_stmt.excluded.education,
+            "work_history": insert_stmt.excluded.work_history,
+        }
+    )
+
+
+def resume_insert(rows: list[dict]):
+    """Inserts resumes, skipping any whose content is already stored; returns the new ids."""
+    return (
+        pg_insert(resumes).values(rows)
+        .on_conflict_do_nothing(index_elements=["content_hash"])
+        .returning(resumes.c.id)
+    )
+
+
+def resume_row(result: dict):
+    # Postgres text columns cannot hold NUL, which some PDFs produce
+    content = result["text"].replace("\x00", "")
+    return {
+        "filename": result["filename"],
+        "content": content,
+        "content_hash": hashlib.sha256(content.encode()).hexdigest(),
+    }
+
+
+def profile_row(parsed: dict):
+    return {
+        "full_name": parsed["full_name"] or "Unknown",
+        "email": parsed["email"],
+        "phone": parsed["phone"],
+        "education": parsed["education"],
+        "work_history": parsed["work_history"],
+    }
+
+
+class IngestProgress:
+    def __init__(self):
+        self.status = "pending"
+        self.total = 0
+        self.parsed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.profiles_upserted = 0
+        self.resumes_inserted = 0
+        self.duplicate_resumes = 0
+        self.errors = []
+        self.started_at = None
+        self.finished_at = None
+
+    def record_error(self, filename: str, error: str, failed: bool = True):
+        """Reports an error; with ``failed=False`` it is listed without counting a file as failed."""
+        if failed:
+            self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"filename": filename, "error": error})
+
+    @property
+    def elapsed(self):
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    def to_dict(self):
+        elapsed = self.elapsed
+        return {
+            "status": self.status,
+            "total": self.total,
+            "parsed": self.parsed,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "profiles_upserted": self.profiles_upserted,
+            "resumes_inserted": self.resumes_inserted,
+            "duplicate_resumes": self.duplicate_resumes,
+            "elapsed_seconds": round(elapsed, 3),
+            "resumes_per_second": round(self.parsed / elapsed, 1) if elapsed else 0.0,
+            "errors": self.errors,
+        }
+
+
+class ResumeIngestor:
+    """Parses many resume PDFs in worker processes and writes them to Postgres in batches.
+
+    Each batch becomes one multi-row upsert into user_profiles plus one
+    multi-row insert into resumes, which skips resumes whose content is
+    already stored. If a batch fails, its rows are retried one at a time so a
+    single bad row only fails itself. With ``database=None`` nothing is
+    written (dry run). ``on_profiles`` is awaited with the profile rows once
+    they are committed; if it raises, the error is reported in the progress.
+    """
+
+    def __init__(
+        self,
+        database,
+        workers: int | None = None,
+        batch_size: int = 200,
+        chunk_size: int = 16,
+        max_pages: int = 20,
+        max_bytes: int = 10 * 1024 * 1024,
+        on_profiles=None,
+    ):
+        self.database = database
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.on_profiles = on_profiles
+        self._executor = None
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def ingest(self, path: str, progress: IngestProgress | None = None, on_progress=None):
+        progress = progress or IngestProgress()
+        progress.status = "running"
+        progress.started_at = time.monotonic()
+        try:
+            archive, names = list_pdfs(path)
+            progress.total = len(names)
+            await self._run(archive, names, progress, on_progress)
+            progress.status = "done"
+        except Exception:
+            progress.status = "failed"
+            raise
+        finally:
+            progress.finished_at = time.monotonic()
+        return progress
+
+    async def _run(self, archive, names, progress, on_progress):
+        loop = asyncio.get_running_loop()
+        chunks = [names[i:i + self.chunk_size] for i in range(0, len(names), self.chunk_size)]
+        # Keep the workers busy without queueing the whole corpus in memory at once
+        max_in_flight = self.workers * 2
+        in_flight = {}
+        pending_rows = []
+
+        next_chunk = 0
+        while next_chunk < len(chunks) or in_flight:
+            while next_chunk < len(chunks) and len(in_flight) < max_in_flight:
+                future = loop.run_in_executor(
+                    self.executor, parse_pdf_batch, archive, chunks[next_chunk], self.max_pages, self.max_bytes
+                )
+                in_flight[future] = chunks[next_chunk]
+                next_chunk += 1
+
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                chunk = in_flight.pop(future)
+                try:
+                    results = future.result()
+                except Exception as e:
+                    # A worker died (e.g. a PDF crashed the parser); fail its chunk and start a fresh pool
+                    if isinstance(e, BrokenProcessPool):
+                        self.shutdown()
+                    results = [{"filename": os.path.basename(name), "error": f"{type(e).__name__}: {e}"} for name in chunk]
+                for result in results:
+                    if "error" in result:
+                        progress.record_error(result["filename"], result["error"])
+                    else:
+                        progress.parsed += 1
+                        pending_rows.append(result)
+
+            while len(pending_rows) >= self.batch_size:
+                batch, pending_rows = pending_rows[:self.batch_size], pending_rows[self.batch_size:]
+                await self._write_batch(batch, progress)
+            if on_progress:
+                on_progress(progress)
+
+        if pending_rows:
+            await self._write_batch(pending_rows, progress)
+            if on_progress:
+                on_progress(progress)
+
+    async def _write_batch(self, results: list[dict], progress: IngestProgress):
+        # One row per email: Postgres rejects an upsert that touches the same row twice
+        profiles = {}
+        for result in results:
+            if result["parsed"]["email"]:
+                profiles[result["parsed"]["email"]] = profile_row(result["parsed"])
+            else:
+                progress.skipped += 1
+        resume_rows = [resume_row(result) for result in results]
+
+        if self.database is None:
+            progress.profiles_upserted += len(profiles)
+            progress.resumes_inserted += len(resume_rows)
+            return
+
+        try:
+            async with self.database.transaction():
+                if profiles:
+                    await self.database.execute(profile_upsert(list(profiles.values())))
+                inserted = len(await self.database.fetch_all(resume_insert(resume_rows)))
+        except Exception:
+            await self._write_rows(list(profiles.values()), resume_rows, progress)
+            return
+        progress.profiles_upserted += len(profiles)
+        progress.resumes_inserted += inserted
+        progress.duplicate_resumes += len(resume_rows) - inserted
+        await self._profiles_written(list(profiles.values()), progress)
+
+    async def _profiles_written(self, rows: list[dict], progress: IngestProgress):
+        # The rows are committed by now; a failing callback is reported, not retried as a write
+        if not self.on_profiles or not rows:
+            return
+        try:
+            await self.on_profiles(rows)
+        except Exception as e:
+            progress.record_error("on_profiles", f"{type(e).__name__}: {e}", failed=False)
+
+    async def _write_rows(self, profiles: list[dict], resume_rows: list[dict], progress: IngestProgress):
+        written = []
+        for row in profiles:
+            try:
+                await self.database.execute(profile_upsert([row]))
+                progress.profiles_upserted += 1
+                written.append(row)
+            except Exception as e:
+                progress.record_error(row["email"], f"{type(e).__name__}: {e}")
+        await self._profiles_written(written, progress)
+        for row in resume_rows:
+            try:
+                if await self.database.fetch_all(resume_insert([row])):
+                    progress.resumes_inserted += 1
+                else:
+                    progress.duplicate_resumes += 1
+            except Exception as e:
+                progress.record_error(row["filename"], f"{type(e).__name__}: {e}")
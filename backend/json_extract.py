@@ -0,0 +1,240 @@
+import json
+import re
+from bisect import bisect_left, bisect_right
+
+THINK_OPEN = "<think>"
+THINK_CLOSE = "</think>"
+
+# Expected shape of a single resume analysis
+ANALYSIS_SCHEMA = {"match_score": (int, float), "suggestions": list}
+
+# Only the characters that can change scanner state; a backslash is matched together with
+# the character it escapes so an escaped quote never toggles string state.
+_TOKENS = re.compile(r'<think>|</think>|\\.|[{}\[\]"]', re.S)
+_OPENERS = {'}': '{', ']': '['}
+_OPENER_TOKENS = {opener: re.compile(r'<think>|</think>|' + re.escape(opener)) for opener in '{['}
+# Longest token that can be cut in half at a chunk boundary
+_HOLD_BACK = len(THINK_CLOSE)
+
+_decoder = json.JSONDecoder()
+
+
+def decode_at(text: str, start: int):
+    """``raw_decode`` of the value at ``start``, reading a window that grows only while the value does.
+
+    A failed decode on the whole text costs O(start) just to build the error
+    (it counts the lines before it), which adds up over many attempts.
+    """
+    size = 1024
+    while True:
+        window = text[start:start + size]
+        try:
+            return _decoder.raw_decode(window)[0]
+        except json.JSONDecodeError as e:
+            # An error at the window's end, or a string that never closed, may just be the cut
+            cut = e.pos >= len(window) - 8 or e.msg.startswith("Unterminated string")
+            if start + size >= len(text) or not cut:
+                raise
+        size *= 4
+
+
+def matches_schema(value, schema: dict | None):
+    if not isinstance(value, dict):
+        return False
+    if schema is None:
+        return True
+    return all(
+        key in value and isinstance(value[key], types) and not isinstance(value[key], bool)
+        for key, types in schema.items()
+    )
+
+
+class JSONStreamExtractor:
+    """Single-pass extractor for the first JSON object (or array) in model output.
+
+    Text is fed in chunks as it arrives. The scanner jumps between structural
+    characters, tracks bracket nesting and string state, skips <think> blocks,
+    and only calls ``raw_decode`` once a balanced candidate has closed, so the
+    work is linear in the output length instead of trying every brace pair.
+
+    A stray quote in prose flips string state for everything after it, which
+    can hide the answer. When a span that contained quotes fails to parse, the
+    scanner carries on, and if nothing is found by ``close`` every opener from
+    that span onwards is tried once with ``raw_decode``, which fails within a
+    few characters on prose.
+    """
+
+    def __init__(self, schema: dict | None = ANALYSIS_SCHEMA, array: bool = False):
+        self.schema = schema
+        self.array = array
+        self.opener = '[' if array else '{'
+        self.result = None
+        # Fed chunks are kept as a list, with their offsets, and only joined when needed
+        self._chunks = []
+        self._offsets = []
+        self._length = 0
+        self._pos = 0
+        self._in_think = False
+        self._in_string = False
+        self._stack = []
+        self._nested = []
+        # Whether a string was opened inside the current outermost bracket
+        self._quoted = False
+        # Where close() starts trying every opener, once a quoted span has failed
+        self._fallback_from = None
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def buffer(self):
+        """Everything fed so far."""
+        if len(self._chunks) > 1:
+            self._chunks, self._offsets = ["".join(self._chunks)], [0]
+        return self._chunks[0] if self._chunks else ""
+
+    @property
+    def span_start(self):
+        """Offset of the outermost bracket still open, if the scanner is inside one."""
+        return self._stack[0][1] if self._stack else None
+
+    def text(self, start: int, end: int | None = None):
+        """``buffer[start:end]``, joining only the chunks it covers."""
+        end = self._length if end is None else min(end, self._length)
+        if start >= end:
+            return ""
+        first = bisect_right(self._offsets, start) - 1
+        last = bisect_left(self._offsets, end)
+        base = self._offsets[first]
+        return "".join(self._chunks[first:last])[start - base:end - base]
+
+    def feed(self, chunk: str):
+        if chunk:
+            self._chunks.append(chunk)
+            self._offsets.append(self._length)
+            self._length += len(chunk)
+        if self.result is None:
+            self._scan(final=False)
+        return self.result
+
+    def close(self):
+        if self.result is None:
+            self._scan(final=True)
+        if self.result is None and self._fallback_from is not None:
+            self._try_every_opener(self._fallback_from)
+        return self.result
+
+    def _accept(self, value):
+        if self.array:
+            return (
+                isinstance(value, list) and bool(value)
+                and all(isinstance(item, dict) for item in value)
+                and (self.schema is None or all(matches_schema(item, self.schema) for item in value))
+            )
+        return matches_schema(value, self.schema)
+
+    def _evaluate(self, candidates):
+        for start, end in sorted(candidates):
+            try:
+                value, _ = _decoder.raw_decode(self.text(start, end))
+            except (ValueError, RecursionError):
+                continue
+            if self._accept(value):
+                self.result = value
+                return True
+        return False
+
+    def _failed_span(self, start: int):
+        if self._quoted and self._fallback_from is None:
+            self._fallback_from = start
+        self._quoted = False
+
+    def _try_every_opener(self, position: int):
+        """Decodes at each opener from ``position`` on, outside <think> blocks, until one is accepted."""
+        buffer = self.buffer
+        in_think = False
+        for match in _OPENER_TOKENS[self.opener].finditer(buffer, position):
+            token = match.group()
+            if token == THINK_OPEN or token == THINK_CLOSE:
+                in_think = token == THINK_OPEN
+                continue
+            if in_think:
+                continue
+            try:
+                value = decode_at(buffer, match.start())
+            except (ValueError, RecursionError):
+                continue
+            if self._accept(value):
+                self.result = value
+                return
+
+    def _scan(self, final: bool):
+        offset = self._pos
+        window = self.text(offset)
+        for match in _TOKENS.finditer(window):
+            token = match.group()
+            self._pos = offset + match.end()
+
+            if self._in_think:
+                if token == THINK_CLOSE:
+                    self._in_think = False
+                continue
+            if self._in_string:
+                if token == '"':
+                    self._in_string = False
+                continue
+
+            if token == THINK_OPEN or token == THINK_CLOSE:
+                if not self._stack:
+                    self._in_think = token == THINK_OPEN
+            elif token == '"':
+                if self._stack:
+                    self._in_string = True
+                    self._quoted = True
+            elif token == '{' or token == '[':
+                self._stack.append((token, offset + match.start()))
+            elif token == '}' or token == ']':
+                if not self._stack:
+                    continue
+                outer_start = self._stack[0][1]
+                opener, start = self._stack.pop()
+                if opener != _OPENERS[token]:
+                    # Mismatched bracket: the enclosing text is not JSON, keep only what closed inside it
+                    self._stack.clear()
+                    candidates, self._nested = self._nested, []
+                    if self._evaluate(candidates):
+                        return
+                    self._failed_span(outer_start)
+                    continue
+                if self._stack:
+                    if opener == self.opener:
+                        self._nested.append((start, self._pos))
+                    continue
+                candidates, self._nested = self._nested, []
+                if opener == self.opener:
+                    candidates.append((start, self._pos))
+                if self._evaluate(candidates):
+                    return
+                self._failed_span(start)
+
+        if not final:
+            # Never skip past a tag or escape that may be completed by the next chunk
+            self._pos = max(self._pos, self._length - _HOLD_BACK)
+        elif self._stack:
+            # An outer bracket never closed, but a complete value may sit inside it
+            outer_start = self._stack[0][1]
+            if not self._evaluate(self._nested):
+                self._failed_span(outer_start)
+
+
+def extract_json(text: str, schema: dict | None = ANALYSIS_SCHEMA, array: bool = False):
+    """Returns the first JSON value in text matching the schema, or None.
+
+    Everything up to the last </think> is reasoning and is skipped outright.
+    """
+    think_end = text.rfind(THINK_CLOSE)
+    if think_end != -1:
+        text = text[think_end + len(THINK_CLOSE):]
+    extractor = JSONStreamExtractor(schema=schema, array=array)
+    extractor.feed(text)
+    return extractor.close()
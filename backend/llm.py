@@ -0,0 +1,242 @@
+import asyncio
+import json
+import os
+import random
+import time
+
+import httpx
+
+from backend.metrics import LLM_QUEUE_WAIT_SECONDS, LLM_RETRIES, LLM_TOKENS, LLM_UPSTREAM_SECONDS
+
+SYSTEM_PROMPT = "You are a job application assistant."
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class LLMError(Exception):
+    def __init__(self, message: str, status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class LLMGateway:
+    """Async chat-completions client sharing one connection pool across requests.
+
+    In-flight calls are capped by a semaphore; 429/5xx responses and transport
+    errors are retried with full-jitter exponential backoff. Pass an httpx
+    transport (e.g. ``httpx.ASGITransport``) to talk to a fake server in-process.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: str | None,
+        model: str | None,
+        api_version: str = "2024-05-01-preview",
+        max_concurrency: int = 8,
+        timeout: float = 60.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.endpoint = endpoint.rstrip("/")
+        self.api_key = api_key
+        self.model = model
+        self.api_version = api_version
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.transport = transport
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client = None
+
+    @classmethod
+    def from_env(cls, **kwargs):
+        return cls(
+            endpoint=os.getenv("AZURE_OPENAI_API_URL", "") + "/models",
+            api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+            model=os.getenv("AZURE_DEPLOYMENT_NAME"),
+            max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "8")),
+            timeout=float(os.getenv("LLM_TIMEOUT", "60")),
+            max_retries=int(os.getenv("LLM_MAX_RETRIES", "3")),
+            **kwargs,
+        )
+
+    @property
+    def client(self):
+        if self._client is None:
+            headers = {}
+            if self.api_key:
+                headers["api-key"] = self.api_key
+                headers["Authorization"] = f"Bearer {self.api_key}"
+            self._client = httpx.AsyncClient(
+                base_url=self.endpoint,
+                headers=headers,
+                timeout=httpx.Timeout(self.timeout, connect=min(self.timeout, 10.0)),
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency
+                ),
+                transport=self.transport,
+            )
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _payload(self, prompt: str, max_tokens: int, stream: bool = False):
+        payload = {
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            "max_tokens": max_tokens,
+            "model": self.model,
+        }
+        if stream:
+            payload["stream"] = True
+        return payload
+
+    def _backoff(self, attempt: int, retry_after: str | None = None):
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    async def _acquire_slot(self, mode: str):
+        started = time.perf_counter()
+        await self._semaphore.acquire()
+        LLM_QUEUE_WAIT_SECONDS.observe(time.perf_counter() - started, mode=mode)
+
+    def _record_usage(self, usage: dict | None):
+        if not isinstance(usage, dict):
+            return
+        for kind in ("prompt_tokens", "completion_tokens"):
+            if isinstance(usage.get(kind), int):
+                LLM_TOKENS.observe(usage[kind], kind=kind.removesuffix("_tokens"))
+
+    async def complete(self, prompt: str, max_tokens: int = 1024, timeout: float | None = None):
+        data = await self._post(self._payload(prompt, max_tokens), timeout)
+        try:
+            return data["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError):
+            raise LLMError("Malformed chat completion response")
+
+    async def _post(self, payload: dict, timeout: float | None):
+        request_timeout = self.timeout if timeout is None else timeout
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            await self._acquire_slot("complete")
+            started, outcome = time.perf_counter(), "error"
+            try:
+                response = await self.client.post(
+                    "/chat/completions",
+                    params={"api-version": self.api_version},
+                    json=payload,
+                    timeout=request_timeout
+                )
+            except httpx.TimeoutException:
+                error = LLMError(f"LLM request timed out after {request_timeout}s")
+                outcome = "timeout"
+            except httpx.TransportError as e:
+                error = LLMError(f"LLM transport error: {e}")
+            else:
+                if response.status_code < 400:
+                    try:
+                        data = response.json()
+                    except ValueError:
+                        raise LLMError("Malformed chat completion response")
+                    self._record_usage(data.get("usage") if isinstance(data, dict) else None)
+                    outcome = "ok"
+                    return data
+                error = LLMError(
+                    f"LLM request failed with {response.status_code}: {response.text[:200]}",
+                    response.status_code
+                )
+                outcome = str(response.status_code)
+                if response.status_code not in RETRY_STATUSES:
+                    raise error
+                retry_after = response.headers.get("retry-after")
+            finally:
+                self._semaphore.release()
+                LLM_UPSTREAM_SECONDS.observe(time.perf_counter() - started, mode="complete", outcome=outcome)
+
+            if attempt == self.max_retries:
+                raise error
+            LLM_RETRIES.inc(mode="complete")
+            await asyncio.sleep(self._backoff(attempt, retry_after))
+
+    def _stream_deltas(self, data: str):
+        """Content deltas in one SSE data payload; raises ValueError if it is not a completion chunk."""
+        chunk = json.loads(data)
+        if not isinstance(chunk, dict) or not isinstance(chunk.get("choices") or [], list):
+            raise ValueError("Chat completion chunk is not an object with a list of choices")
+        self._record_usage(chunk.get("usage"))
+        deltas = []
+        for choice in chunk.get("choices") or []:
+            delta = choice.get("delta") if isinstance(choice, dict) else None
+            content = delta.get("content") if isinstance(delta, dict) else None
+            if content:
+                deltas.append(content)
+        return deltas
+
+    async def stream(self, prompt: str, max_tokens: int = 1024, timeout: float | None = None):
+        """Yields content deltas as they arrive. Only failures before the first delta are retried."""
+        payload = self._payload(prompt, max_tokens, stream=True)
+        request_timeout = self.timeout if timeout is None else timeout
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            started = False
+            await self._acquire_slot("stream")
+            request_started, outcome = time.perf_counter(), "error"
+            try:
+                async with self.client.stream(
+                    "POST",
+                    "/chat/completions",
+                    params={"api-version": self.api_version},
+                    json=payload,
+                    timeout=request_timeout
+                ) as response:
+                    if response.status_code < 400:
+                        async for line in response.aiter_lines():
+                            if not line.startswith("data:"):
+                                continue
+                            data = line[len("data:"):].strip()
+                            if data == "[DONE]":
+                                outcome = "ok"
+                                return
+                            for delta in self._stream_deltas(data):
+                                started = True
+                                yield delta
+                        outcome = "ok"
+                        return
+                    await response.aread()
+                    error = LLMError(
+                        f"LLM request failed with {response.status_code}: {response.text[:200]}",
+                        response.status_code
+                    )
+                    outcome = str(response.status_code)
+                    if response.status_code not in RETRY_STATUSES:
+                        raise error
+                    retry_after = response.headers.get("retry-after")
+            except httpx.TimeoutException:
+                error = LLMError(f"LLM request timed out after {request_timeout}s")
+                outcome = "timeout"
+            except httpx.TransportError as e:
+                error = LLMError(f"LLM transport error: {e}")
+            except ValueError:
+                error = LLMError("Malformed chat completion stream")
+            finally:
+                self._semaphore.release()
+                LLM_UPSTREAM_SECONDS.observe(time.perf_counter() - request_started, mode="stream", outcome=outcome)
+
+            if started or attempt == self.max_retries:
+                raise error
+            LLM_RETRIES.inc(mode="stream")
+            await asyncio.sleep(self._backoff(attempt, retry_after))
@@ -1,32 +1,181 @@
-from fastapi import FastAPI, HTTPException, File, UploadFile
+from fastapi import FastAPI, HTTPException, File, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
-from database import database
-from models import user_profiles
+from database import database, pool_stats
+from models import applications, user_profiles
+from backend.cache import AnalysisCache, ProfileCache, SingleFlight, analysis_cache_key
+from backend.llm import LLMGateway, LLMError
+from backend.streaming import AnalysisStreamParser, sse_event
+from backend.json_extract import extract_json
+from backend.pdf_extract import PDFExtractor, PDFPoolSaturated, PDFTooLarge
+from backend.resume_parser import parse_resume
+from backend.ingest import IngestProgress, ResumeIngestor
+from backend.applications import ApplicationStatus, load_dashboard, status_update_query
+from backend.matching import TfidfIndex, profile_text, rank_documents
+from backend.metrics import (
+    DB_POOL_WAIT_SECONDS, HTTP_REQUEST_SECONDS, STAGE_SECONDS, SamplingProfiler, instrument_database,
+    render as render_metrics
+)
 import os
-import json
-import re
-import pdfplumber
-from io import BytesIO
+import asyncio
+import logging
+import tempfile
+import time
+import uuid
+import zipfile
+from concurrent.futures.process import BrokenProcessPool
 from dotenv import load_dotenv
 from contextlib import asynccontextmanager
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-# Azure SDK imports
-from azure.ai.inference import ChatCompletionsClient
-from azure.ai.inference.models import SystemMessage, UserMessage
-from azure.core.credentials import AzureKeyCredential
-
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+instrument_database(database)
+pool_stats.observers.append(DB_POOL_WAIT_SECONDS.observe)
+
+# Per-request sampling profiles, requested with an X-Profile header once enabled
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() in ("1", "true", "yes")
+PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join(tempfile.gettempdir(), "job-assistant-profiles"))
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL", "0.005"))
+
+# Azure AI inference gateway (AZURE_OPENAI_API_URL / _API_KEY / AZURE_DEPLOYMENT_NAME)
+llm = LLMGateway.from_env()
+pdf_extractor = PDFExtractor.from_env()
+
+# Local TF-IDF index over user profiles, keyed by email, for instant pre-scoring before the LLM
+MATCH_FEATURES = int(os.getenv("MATCH_FEATURES", "4096"))
+MATCH_MAX_TOP_K = 100
+MATCH_MAX_JOB_DESCRIPTIONS = 1000
+# Each worker process has its own index; these bound how long profiles written by other workers take to show up
+MATCH_REFRESH_SECONDS = float(os.getenv("MATCH_REFRESH_SECONDS", "30"))
+MATCH_FULL_REFRESH_SECONDS = float(os.getenv("MATCH_FULL_REFRESH_SECONDS", "600"))
+resume_index = TfidfIndex(MATCH_FEATURES)
+resume_index_watermark = 0
+
+def index_profiles(rows):
+    for row in rows:
+        if row["email"]:
+            resume_index.add(row["email"], profile_text(row))
+
+async def refresh_resume_index(full: bool = False):
+    """Indexes profiles with an id above the last one seen, or every profile with ``full``.
+
+    New profiles are caught by the id watermark; changes to existing ones made
+    by another worker only arrive with the next full refresh.
+    """
+    global resume_index_watermark
+    query = user_profiles.select().with_only_columns(
+        user_profiles.c.id, user_profiles.c.email, user_profiles.c.education, user_profiles.c.work_history
+    )
+    if not full:
+        query = query.where(user_profiles.c.id > resume_index_watermark)
+    batch = []
+    async for row in database.iterate(query):
+        resume_index_watermark = max(resume_index_watermark, row["id"])
+        batch.append(row)
+        if len(batch) == 500:
+            await asyncio.to_thread(index_profiles, batch)
+            batch = []
+    await asyncio.to_thread(index_profiles, batch)
+
+async def keep_resume_index_fresh():
+    last_full = time.monotonic()
+    while True:
+        await asyncio.sleep(MATCH_REFRESH_SECONDS)
+        full = time.monotonic() - last_full >= MATCH_FULL_REFRESH_SECONDS
+        try:
+            await refresh_resume_index(full)
+        except Exception:
+            logger.exception("Refreshing the resume index failed; retrying in %ss", MATCH_REFRESH_SECONDS)
+            continue
+        if full:
+            last_full = time.monotonic()
+
+profile_cache = ProfileCache.from_env(database)
+
+async def profiles_changed(rows):
+    """Called after profiles are written: refreshes the match index and drops cached copies."""
+    await asyncio.to_thread(index_profiles, rows)
+    for row in rows:
+        if row["email"]:
+            await profile_cache.invalidate(row["email"])
+
+ingestor = ResumeIngestor(
+    database,
+    workers=int(os.getenv("INGEST_WORKERS", "0")) or None,
+    batch_size=int(os.getenv("INGEST_BATCH_SIZE", "200")),
+    max_pages=pdf_extractor.max_pages,
+    max_bytes=pdf_extractor.max_bytes,
+    on_profiles=profiles_changed
+)
+INGEST_MAX_ARCHIVE_BYTES = int(os.getenv("INGEST_MAX_ARCHIVE_BYTES", str(1024 * 1024 * 1024)))
+# Finished ingestion jobs stay pollable this long before they are dropped
+INGEST_JOB_TTL = float(os.getenv("INGEST_JOB_TTL", "3600"))
+ingest_jobs = {}
+
+def prune_ingest_jobs():
+    now = time.monotonic()
+    for job_id, job in list(ingest_jobs.items()):
+        finished_at = job["progress"].finished_at
+        if job["task"].done() and finished_at is not None and now - finished_at > INGEST_JOB_TTL:
+            del ingest_jobs[job_id]
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await database.connect()
+    pool_stats.instrument(database)
+    await refresh_resume_index(full=True)
+    index_refresher = asyncio.create_task(keep_resume_index_fresh())
     yield
+    index_refresher.cancel()
+    # Stop running ingestion jobs while the database and worker pool they use are still up
+    running = [job["task"] for job in ingest_jobs.values() if not job["task"].done()]
+    for task in running:
+        task.cancel()
+    await asyncio.gather(*running, return_exceptions=True)
+    await llm.aclose()
+    pdf_extractor.shutdown()
+    ingestor.shutdown()
     await database.disconnect()
 
 app = FastAPI(lifespan=lifespan)
 
+def write_profile(profiler: SamplingProfiler, method: str, route: str):
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    name = f"{time.time_ns()}-{method}-{route.strip('/').replace('/', '_') or 'root'}.folded"
+    path = os.path.join(PROFILE_DIR, name)
+    with open(path, "w") as profile:
+        profile.write(profiler.folded())
+    return path
+
+@app.middleware("http")
+async def observe_request(request: Request, call_next):
+    profiler = None
+    if PROFILING_ENABLED and request.headers.get("x-profile"):
+        profiler = SamplingProfiler(interval=PROFILE_INTERVAL).start()
+
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+    finally:
+        # The route template, not the raw path, so /profile/{email} is one series
+        route = request.scope.get("route")
+        route = route.path if route else "unmatched"
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - started, method=request.method, route=route, status=status
+        )
+        if profiler:
+            profiler.stop()
+
+    if profiler:
+        response.headers["X-Profile-File"] = await asyncio.to_thread(write_profile, profiler, request.method, route)
+    return response
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Restrict in production
@@ -35,24 +184,48 @@ app.add_middleware(
     allow_headers=["*"]
 )
 
-# Azure OpenAI config
-AZURE_OPENAI_API_URL = os.getenv("AZURE_OPENAI_API_URL") + "/models"
-AZURE_OPENAI_API_KEY = os.getenv("AZURE_OPENAI_API_KEY")
-AZURE_DEPLOYMENT_NAME = os.getenv("AZURE_DEPLOYMENT_NAME")
+result_cache = AnalysisCache.from_env(database)
+inflight = SingleFlight()
 
-client = ChatCompletionsClient(
-    endpoint=AZURE_OPENAI_API_URL,
-    credential=AzureKeyCredential(AZURE_OPENAI_API_KEY),
-    api_version="2024-05-01-preview"
-)
+# Job descriptions packed into one batched prompt, bounded by a rough prompt token budget
+BATCH_TOKEN_BUDGET = int(os.getenv("LLM_BATCH_TOKEN_BUDGET", "6000"))
+BATCH_MAX_JOBS = int(os.getenv("LLM_BATCH_MAX_JOBS", "4"))
+BATCH_MAX_REQUEST_JOBS = 50
+
+DASHBOARD_MAX_PAGE_SIZE = 200
 
 class ResumeRequest(BaseModel):
     resume_text: str
     job_description: str
+    bypass_cache: bool = False
+
+class BatchResumeRequest(BaseModel):
+    resume_text: str
+    job_descriptions: list[str]
+    bypass_cache: bool = False
+
+class ResumeMatchRequest(BaseModel):
+    job_description: str
+    top_k: int = 10
+    analyze: bool = False
+    bypass_cache: bool = False
+
+class JobMatchRequest(BaseModel):
+    resume_text: str
+    job_descriptions: list[str]
+    top_k: int = 10
+    analyze: bool = False
+    bypass_cache: bool = False
 
 class StatusUpdate(BaseModel):
     id: int
-    status: str
+    status: ApplicationStatus
+
+class ApplicationCreate(BaseModel):
+    user_email: str
+    company: str
+    role: str
+    status: ApplicationStatus = "Applied"
 
 class UserProfile(BaseModel):
     full_name: str
@@ -61,60 +234,26 @@ class UserProfile(BaseModel):
     work_history: str | None = None
     education: str | None = None
 
-applications = [
-    {"id": 1, "company": "OpenAI", "role": "ML Engineer", "status": "Interview"},
-    {"id": 2, "company": "Google", "role": "Frontend Dev", "status": "Applied"},
-    {"id": 3, "company": "Amazon", "role": "Data Analyst", "status": "Rejected"},
-    {"id": 4, "company": "Meta", "role": "UX Designer", "status": "Applied"},
-    {"id": 5, "company": "Netflix", "role": "Data Engineer", "status": "Rejected"},
-]
-
-def extract_json(text: str):
-    start = text.find('{')
-    while start != -1:
-        end = text.find('}', start)
-        while end != -1:
-            candidate = text[start:end+1]
-            try:
-                json.loads(candidate)
-                return candidate
-            except json.JSONDecodeError:
-                end = text.find('}', end+1)
-        start = text.find('{', start+1)
-    return None
-
-async def call_deepseek(prompt: str):
-    import asyncio
-    loop = asyncio.get_event_loop()
-
-    def sync_call():
-        response = client.complete(
-            messages=[
-                SystemMessage(content="You are a job application assistant."),
-                UserMessage(content=prompt)
-            ],
-            max_tokens=1024,
-            model=AZURE_DEPLOYMENT_NAME
-        )
-        return response.choices[0].message.content
-
-    return await loop.run_in_executor(None, sync_call)
+async def call_deepseek(prompt: str, max_tokens: int = 1024):
+    try:
+        return await llm.complete(prompt, max_tokens=max_tokens)
+    except LLMError as e:
+        raise HTTPException(status_code=502, detail=str(e))
 
 @app.get("/")
 def root():
     return {"message": "Job Application Assistant API is running!"}
 
-@app.post("/api/resume/analyze")
-async def analyze_resume(data: ResumeRequest):
-    prompt = f"""
+def build_analysis_prompt(resume_text: str, job_description: str):
+    return f"""
 Compare the following resume to the job description.
 Give a match score out of 100 and suggest 3 improvements.
 
 Resume:
-{data.resume_text}
+{resume_text}
 
 Job Description:
-{data.job_description}
+{job_description}
 
 Return ONLY a JSON object EXACTLY like this (no other text or explanation):
 
@@ -124,93 +263,261 @@ Return ONLY a JSON object EXACTLY like this (no other text or explanation):
 }}
     """
 
-    raw_output = await call_deepseek(prompt)
-    json_text = extract_json(raw_output)
-    if json_text:
-        try:
-            result = json.loads(json_text)
-            return result
-        except Exception as e:
-            return {
-                "match_score": 0,
-                "suggestions": [
-                    "Failed to parse extracted JSON.",
-                    f"Error: {str(e)}",
-                    "Raw output:",
-                    raw_output
-                ]
-            }
+def parse_analysis(raw_output: str):
+    """Returns (result, ok); ok is False when the fallback error payload was built."""
+    with STAGE_SECONDS.time(stage="extract_json"):
+        result = extract_json(raw_output)
+    if result is not None:
+        return result, True
+    return {
+        "match_score": 0,
+        "suggestions": [
+            "Failed to find JSON in the DeepSeek response.",
+            "Raw output:",
+            raw_output
+        ]
+    }, False
+
+def build_batch_analysis_prompt(resume_text: str, job_descriptions: list[str]):
+    jobs = "\n\n".join(
+        f"Job Description {number}:\n{job_description}"
+        for number, job_description in enumerate(job_descriptions, start=1)
+    )
+    return f"""
+Compare the following resume to each of the {len(job_descriptions)} numbered job descriptions.
+For each job description give a match score out of 100 and suggest 3 improvements.
+
+Resume:
+{resume_text}
+
+{jobs}
+
+Return ONLY a JSON array with one object per job description, in order, EXACTLY like this (no other text or explanation):
+
+[
+  {{"job": 1, "match_score": 87, "suggestions": ["Fix X", "Improve Y", "Add Z"]}},
+  {{"job": 2, "match_score": 64, "suggestions": ["Fix X", "Improve Y", "Add Z"]}}
+]
+    """
+
+def parse_batch_analysis(raw_output: str, count: int):
+    """Returns one result per job description, or None where the model's answer is missing."""
+    with STAGE_SECONDS.time(stage="extract_json"):
+        items = extract_json(raw_output, schema=None, array=True)
+    if items is None:
+        return [None] * count
+
+    results = [None] * count
+    for position, item in enumerate(items):
+        number = item.get("job")
+        index = number - 1 if isinstance(number, int) else position
+        if 0 <= index < count and "match_score" in item and "suggestions" in item:
+            results[index] = {"match_score": item["match_score"], "suggestions": item["suggestions"]}
+    return results
+
+def estimate_tokens(text: str):
+    return len(text) // 4 + 1
+
+def pack_job_descriptions(resume_text: str, job_descriptions: list[str]):
+    """Groups job description indexes into batches that fit BATCH_TOKEN_BUDGET."""
+    base_cost = estimate_tokens(resume_text) + 200
+    batches, current, used = [], [], base_cost
+    for index, job_description in enumerate(job_descriptions):
+        cost = estimate_tokens(job_description) + 20
+        if current and (len(current) >= BATCH_MAX_JOBS or used + cost > BATCH_TOKEN_BUDGET):
+            batches.append(current)
+            current, used = [], base_cost
+        current.append(index)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+async def run_analysis(resume_text: str, job_description: str, bypass_cache: bool = False):
+    cache_key = analysis_cache_key(resume_text, job_description, llm.model)
+    if bypass_cache:
+        result_cache.record_bypass()
     else:
-        return {
-            "match_score": 0,
-            "suggestions": [
-                "Failed to find JSON in the DeepSeek response.",
-                "Raw output:",
-                raw_output
-            ]
-        }
+        cached = await result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+    return await analyze_uncached(cache_key, resume_text, job_description)
+
+async def analyze_uncached(cache_key: str, resume_text: str, job_description: str):
+    async def analyze():
+        raw_output = await call_deepseek(build_analysis_prompt(resume_text, job_description))
+        result, ok = parse_analysis(raw_output)
+        if ok:
+            await result_cache.set(cache_key, result, model=llm.model)
+        return result
+
+    return await inflight.do(cache_key, analyze)
+
+async def run_batch_analysis(resume_text: str, job_descriptions: list[str], cache_keys: list[str]):
+    if len(job_descriptions) == 1:
+        return [await analyze_uncached(cache_keys[0], resume_text, job_descriptions[0])]
+
+    async def analyze():
+        prompt = build_batch_analysis_prompt(resume_text, job_descriptions)
+        raw_output = await call_deepseek(prompt, max_tokens=min(4096, 1024 * len(job_descriptions)))
+        results = parse_batch_analysis(raw_output, len(job_descriptions))
+        for cache_key, result in zip(cache_keys, results):
+            if result is not None:
+                await result_cache.set(cache_key, result, model=llm.model)
+        return results
+
+    results = await inflight.do("batch:" + ":".join(cache_keys), analyze)
+
+    # Anything the batched answer left out is scored on its own
+    missing = [index for index, result in enumerate(results) if result is None]
+    retried = await asyncio.gather(*[
+        analyze_uncached(cache_keys[index], resume_text, job_descriptions[index]) for index in missing
+    ])
+    results = list(results)
+    for index, result in zip(missing, retried):
+        results[index] = result
+    return results
 
-def split_sections(text: str):
-    pattern = re.compile(
-        r'(education|work experience|professional experience|experience|employment history|skills|projects|certifications|contact information|summary)',
-        re.I
+@app.post("/api/resume/analyze")
+async def analyze_resume(data: ResumeRequest):
+    return await run_analysis(data.resume_text, data.job_description, data.bypass_cache)
+
+async def stream_analysis(cache_key: str, resume_text: str, job_description: str, cached: dict | None):
+    if cached is not None:
+        yield sse_event("match_score", {"match_score": cached.get("match_score")})
+        yield sse_event("result", cached)
+        return
+
+    parser = AnalysisStreamParser()
+    try:
+        async for chunk in llm.stream(build_analysis_prompt(resume_text, job_description), max_tokens=1024):
+            yield sse_event("token", {"text": chunk})
+            match_score = parser.feed(chunk)
+            if match_score is not None:
+                yield sse_event("match_score", {"match_score": match_score})
+    except LLMError as e:
+        yield sse_event("error", {"detail": str(e)})
+        return
+
+    if parser.result is not None:
+        result, ok = parser.result, True
+    else:
+        result, ok = parse_analysis(parser.text)
+    if ok:
+        await result_cache.set(cache_key, result, model=llm.model)
+    yield sse_event("result", result)
+
+@app.post("/api/resume/analyze/stream")
+async def analyze_resume_stream(data: ResumeRequest):
+    cache_key = analysis_cache_key(data.resume_text, data.job_description, llm.model)
+    cached = None
+    if data.bypass_cache:
+        result_cache.record_bypass()
+    else:
+        cached = await result_cache.get(cache_key)
+
+    return StreamingResponse(
+        stream_analysis(cache_key, data.resume_text, data.job_description, cached),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
-    splits = [(m.start(), m.group().lower()) for m in pattern.finditer(text)]
-    sections = {}
-    for i, (start, header) in enumerate(splits):
-        end = splits[i+1][0] if i+1 < len(splits) else len(text)
-        sections[header] = text[start:end].strip()
-    return sections
-
-def extract_contact_info(text: str):
-    email = re.search(r'[\w\.-]+@[\w\.-]+', text)
-    phone = re.search(r'(\+?\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?){1,2}\d{4}', text)
-    return {
-        "email": email.group() if email else None,
-        "phone": phone.group() if phone else None
-    }
 
-def extract_education(text: str):
-    lines = text.split('\n')
-    education_entries = [
-        line.strip() for line in lines
-        if re.search(r'(bachelor|master|ph\.d|degree|university|college)', line, re.I)
+async def score_job_descriptions(resume_text: str, job_descriptions: list[str], bypass_cache: bool = False):
+    """Scores one resume against several job descriptions, from the cache or in packed LLM batches."""
+    cache_keys = [
+        analysis_cache_key(resume_text, job_description, llm.model)
+        for job_description in job_descriptions
+    ]
+    results = [None] * len(job_descriptions)
+    if bypass_cache:
+        result_cache.record_bypass()
+    else:
+        for index, cache_key in enumerate(cache_keys):
+            results[index] = await result_cache.get(cache_key)
+
+    pending = [index for index, result in enumerate(results) if result is None]
+    pending_jobs = [job_descriptions[index] for index in pending]
+    batches = pack_job_descriptions(resume_text, pending_jobs)
+    batch_results = await asyncio.gather(*[
+        run_batch_analysis(
+            resume_text,
+            [pending_jobs[i] for i in batch],
+            [cache_keys[pending[i]] for i in batch]
+        )
+        for batch in batches
+    ])
+    for batch, scored in zip(batches, batch_results):
+        for i, result in zip(batch, scored):
+            results[pending[i]] = result
+    return results
+
+@app.post("/api/resume/analyze/batch")
+async def analyze_resume_batch(data: BatchResumeRequest):
+    if not data.job_descriptions:
+        raise HTTPException(status_code=400, detail="At least one job description is required")
+    if len(data.job_descriptions) > BATCH_MAX_REQUEST_JOBS:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_REQUEST_JOBS} job descriptions per request")
+
+    return {"results": await score_job_descriptions(data.resume_text, data.job_descriptions, data.bypass_cache)}
+
+def check_top_k(top_k: int, analyze: bool):
+    limit = BATCH_MAX_REQUEST_JOBS if analyze else MATCH_MAX_TOP_K
+    if not 1 <= top_k <= limit:
+        raise HTTPException(status_code=400, detail=f"top_k must be between 1 and {limit}")
+
+@app.post("/api/match/resumes")
+async def match_resumes(data: ResumeMatchRequest):
+    """Ranks indexed candidates against a job description; with analyze, the shortlist is scored by the LLM."""
+    check_top_k(data.top_k, data.analyze)
+    ranked = await asyncio.to_thread(resume_index.search, data.job_description, data.top_k)
+    if not ranked:
+        return {"matches": []}
+
+    query = user_profiles.select().where(user_profiles.c.email.in_([email for email, _ in ranked]))
+    profiles = {row["email"]: row for row in await database.fetch_all(query)}
+    matches = [
+        {"email": email, "full_name": profiles[email]["full_name"], "score": round(score, 4)}
+        for email, score in ranked if email in profiles
     ]
-    return "\n".join(education_entries)
-
-def extract_work_experience(text: str):
-    lines = text.split('\n')
-    keywords = r'(engineer|developer|manager|analyst|consultant|intern|researcher|scientist|technician|designer)'
-    experience_entries = []
-    for i, line in enumerate(lines):
-        if re.search(keywords, line, re.I):
-            context = "\n".join(lines[max(0, i-1):i+3])
-            experience_entries.append(context.strip())
-    return "\n\n".join(experience_entries)
-
-def extract_name(text: str):
-    lines = text.strip().split("\n")
-    for line in lines[:5]:
-        clean = line.strip()
-        if len(clean.split()) >= 2 and all(w[0].isupper() for w in clean.split() if w[0].isalpha()):
-            return clean
-    return None
-
-def parse_resume(text: str):
-    sections = split_sections(text)
-    contact_info = extract_contact_info(text)
-    education = extract_education(sections.get('education', ''))
-    work_history = extract_work_experience(
-        sections.get('work experience', '') or sections.get('professional experience', '') or sections.get('experience', '')
+    if data.analyze:
+        analyses = await asyncio.gather(*[
+            run_analysis(profile_text(profiles[match["email"]]), data.job_description, data.bypass_cache)
+            for match in matches
+        ])
+        for match, analysis in zip(matches, analyses):
+            match["analysis"] = analysis
+    return {"matches": matches}
+
+@app.post("/api/match/jobs")
+async def match_jobs(data: JobMatchRequest):
+    """Ranks job descriptions against a resume; with analyze, the shortlist is scored by the LLM."""
+    check_top_k(data.top_k, data.analyze)
+    if len(data.job_descriptions) > MATCH_MAX_JOB_DESCRIPTIONS:
+        raise HTTPException(status_code=400, detail=f"At most {MATCH_MAX_JOB_DESCRIPTIONS} job descriptions per request")
+
+    ranked = await asyncio.to_thread(
+        rank_documents, data.resume_text, data.job_descriptions, data.top_k, MATCH_FEATURES
     )
-    full_name = extract_name(text)
+    matches = [{"index": index, "score": round(score, 4)} for index, score in ranked]
+    if data.analyze and matches:
+        analyses = await score_job_descriptions(
+            data.resume_text, [data.job_descriptions[match["index"]] for match in matches], data.bypass_cache
+        )
+        for match, analysis in zip(matches, analyses):
+            match["analysis"] = analysis
+    return {"matches": matches}
+
+@app.get("/metrics")
+def get_metrics():
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
+@app.get("/api/cache/stats")
+def cache_stats():
     return {
-        "full_name": full_name,
-        "email": contact_info["email"],
-        "phone": contact_info["phone"],
-        "education": education,
-        "work_history": work_history
+        "analysis": result_cache.stats(),
+        "coalescing": inflight.stats(),
+        "profile": profile_cache.stats(),
+        "db_pool": pool_stats.stats(),
     }
 
 @app.post("/api/resume/upload")
@@ -218,11 +525,19 @@ async def upload_resume(file: UploadFile = File(...)):
     if not file.filename.endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Only PDF files are supported")
 
-    file_bytes = await file.read()
-    with pdfplumber.open(BytesIO(file_bytes)) as pdf:
-        text = "\n".join([page.extract_text() or "" for page in pdf.pages])
+    try:
+        text = await pdf_extractor.extract(file)
+    except PDFTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except PDFPoolSaturated as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Timed out extracting text from the PDF")
+    except BrokenProcessPool:
+        raise HTTPException(status_code=500, detail="PDF extraction worker crashed")
 
-    parsed_data = parse_resume(text)
+    with STAGE_SECONDS.time(stage="parse_resume"):
+        parsed_data = parse_resume(text)
 
     insert_stmt = pg_insert(user_profiles).values(
         full_name=parsed_data["full_name"] or "Unknown",
@@ -242,6 +557,7 @@ async def upload_resume(file: UploadFile = File(...)):
     )
 
     record_id = await database.execute(update_stmt)
+    await profiles_changed([parsed_data])
 
     return {
         "id": record_id,
@@ -249,17 +565,76 @@ async def upload_resume(file: UploadFile = File(...)):
         "content_preview": text[:300]
     }
 
+async def run_ingest_job(path: str, progress: IngestProgress):
+    try:
+        await ingestor.ingest(path, progress)
+    except Exception as e:
+        progress.record_error(os.path.basename(path), f"{type(e).__name__}: {e}")
+    finally:
+        os.unlink(path)
+
+@app.post("/api/resume/bulk", status_code=202)
+async def bulk_upload_resumes(file: UploadFile = File(...)):
+    if not file.filename.endswith(".zip"):
+        raise HTTPException(status_code=400, detail="Upload a .zip archive of PDF resumes")
+
+    size = 0
+    with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as archive:
+        while chunk := await file.read(1024 * 1024):
+            size += len(chunk)
+            if size > INGEST_MAX_ARCHIVE_BYTES:
+                archive.close()
+                os.unlink(archive.name)
+                raise HTTPException(status_code=413, detail=f"Archive is larger than {INGEST_MAX_ARCHIVE_BYTES} bytes")
+            archive.write(chunk)
+    if not zipfile.is_zipfile(archive.name):
+        os.unlink(archive.name)
+        raise HTTPException(status_code=400, detail="Upload a .zip archive of PDF resumes")
+
+    prune_ingest_jobs()
+    job_id = uuid.uuid4().hex
+    progress = IngestProgress()
+    ingest_jobs[job_id] = {
+        "progress": progress,
+        "task": asyncio.create_task(run_ingest_job(archive.name, progress)),
+    }
+    return {"job_id": job_id, **progress.to_dict()}
+
+@app.get("/api/resume/bulk/{job_id}")
+def get_bulk_upload(job_id: str):
+    prune_ingest_jobs()
+    job = ingest_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Ingestion job not found")
+    return {"job_id": job_id, **job["progress"].to_dict()}
+
 @app.get("/api/dashboard")
-def get_dashboard():
-    return {"applications": applications}
+async def get_dashboard(
+    user_email: str,
+    status: ApplicationStatus | None = None,
+    company: str | None = None,
+    limit: int = 50,
+    cursor: str | None = None
+):
+    if not 1 <= limit <= DASHBOARD_MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {DASHBOARD_MAX_PAGE_SIZE}")
+    try:
+        return await load_dashboard(database, user_email, status, company, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/api/dashboard/applications")
+async def create_application(application: ApplicationCreate):
+    query = applications.insert().values(**application.model_dump()).returning(*applications.c)
+    row = await database.fetch_one(query)
+    return dict(row._mapping)
 
 @app.post("/api/dashboard/update")
-def update_status(update: StatusUpdate):
-    for app in applications:
-        if app["id"] == update.id:
-            app["status"] = update.status
-            return {"success": True, "updated": app}
-    raise HTTPException(status_code=404, detail="Application not found")
+async def update_status(update: StatusUpdate):
+    row = await database.fetch_one(status_update_query(update.id, update.status))
+    if not row:
+        raise HTTPException(status_code=404, detail="Application not found")
+    return {"success": True, "updated": dict(row._mapping)}
 
 @app.post("/profile/")
 async def create_profile(profile: UserProfile):
@@ -271,12 +646,12 @@ async def create_profile(profile: UserProfile):
         education=profile.education
     )
     last_record_id = await database.execute(query)
+    await profiles_changed([profile.model_dump()])
     return {**profile.model_dump(), "id": last_record_id}
 
 @app.get("/profile/{email}")
 async def get_profile(email: str):
-    query = user_profiles.select().where(user_profiles.c.email == email)
-    profile = await database.fetch_one(query)
+    profile = await profile_cache.get(email)
     if not profile:
         raise HTTPException(status_code=404, detail="Profile not found")
     return profile
@@ -0,0 +1,191 @@
+import re
+import threading
+import zlib
+
+import numpy as np
+
+TOKEN = re.compile(r'[a-z0-9][a-z0-9+#]*')
+STOP_WORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our the their to we will with you your".split()
+)
+
+
+def tokenize(text: str):
+    return [token for token in TOKEN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def hashed_terms(text: str, n_features: int):
+    """Hashes unigrams and bigrams into ``n_features`` buckets with sublinear (log) term frequency.
+
+    Returns the sorted bucket indices that occur and their weights.
+    """
+    tokens = tokenize(text)
+    terms = tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+    buckets = np.fromiter(
+        (zlib.crc32(term.encode()) % n_features for term in terms), dtype=np.int32, count=len(terms)
+    )
+    indices, counts = np.unique(buckets, return_counts=True)
+    return indices, np.log1p(counts.astype(np.float32))
+
+
+def term_frequencies(text: str, n_features: int):
+    """The dense form of ``hashed_terms``."""
+    indices, values = hashed_terms(text, n_features)
+    vector = np.zeros(n_features, dtype=np.float32)
+    vector[indices] = values
+    return vector
+
+
+class TfidfIndex:
+    """Hashed TF-IDF vectors stored sparse, searched by cosine similarity.
+
+    Each document's nonzero (log) term frequencies are appended to flat
+    index/value arrays, so memory follows the number of distinct terms rather
+    than ``n_features``. Document frequencies are a running count. IDF weights
+    and document norms are computed together and kept until more than
+    ``idf_refresh`` of the documents have been added or replaced since; in
+    between, ``add`` computes the new row's norm against the same weights.
+    """
+
+    def __init__(self, n_features: int = 4096, initial_capacity: int = 1024, idf_refresh: float = 0.05):
+        self.n_features = n_features
+        self.idf_refresh = idf_refresh
+        self.keys = []
+        self.rows = {}
+        self._spans = []
+        capacity = initial_capacity * 64
+        self._indices = np.zeros(capacity, dtype=np.int32)
+        self._values = np.zeros(capacity, dtype=np.float32)
+        self._owners = np.zeros(capacity, dtype=np.int32)
+        self._size = 0
+        self._dead = 0
+        self._df = np.zeros(n_features, dtype=np.float32)
+        self._idf = None
+        self._norms = np.zeros(initial_capacity, dtype=np.float32)
+        self._changes = 0
+        # add and search run on worker threads in the app
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self.rows
+
+    def _reserve(self, count: int):
+        if self._size + count <= len(self._values):
+            return
+        capacity = max(2 * len(self._values), self._size + count)
+        for name in ("_indices", "_values", "_owners"):
+            array = getattr(self, name)
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:self._size] = array[:self._size]
+            setattr(self, name, grown)
+
+    def _compact(self):
+        live = np.concatenate([np.arange(start, end) for start, end in self._spans])
+        offset = 0
+        for row, (start, end) in enumerate(self._spans):
+            self._spans[row] = (offset, offset + end - start)
+            offset += end - start
+        for name in ("_indices", "_values", "_owners"):
+            array = getattr(self, name)
+            array[:len(live)] = array[live]
+        self._size = len(live)
+        self._dead = 0
+
+    def add(self, key, text: str):
+        """Indexes ``text`` under ``key``, replacing whatever the key held before."""
+        indices, values = hashed_terms(text, self.n_features)
+        with self._lock:
+            row = self.rows.get(key)
+            if row is None:
+                row = len(self.keys)
+                self.keys.append(key)
+                self.rows[key] = row
+                self._spans.append((0, 0))
+                if row == len(self._norms):
+                    self._norms = np.concatenate([self._norms, np.zeros(max(1024, row), dtype=np.float32)])
+            else:
+                start, end = self._spans[row]
+                self._df[self._indices[start:end]] -= 1
+                self._values[start:end] = 0
+                self._dead += end - start
+
+            self._reserve(len(indices))
+            start, end = self._size, self._size + len(indices)
+            self._indices[start:end] = indices
+            self._values[start:end] = values
+            self._owners[start:end] = row
+            self._spans[row] = (start, end)
+            self._size = end
+            self._df[indices] += 1
+            if self._dead > self._size // 2:
+                self._compact()
+
+            if self._idf is not None:
+                weighted = values * self._idf[indices]
+                self._norms[row] = np.sqrt(weighted @ weighted)
+                self._changes += 1
+
+    def idf(self):
+        # Smoothed as in scikit-learn, so terms present in every document still count a little
+        return np.log((1 + len(self.keys)) / (1 + self._df)) + 1
+
+    def _weights(self):
+        """IDF weights and document norms, recomputed once enough of the corpus has changed."""
+        if self._idf is None or self._changes > self.idf_refresh * len(self.keys):
+            self._idf = self.idf().astype(np.float32)
+            weighted = self._values[:self._size] * self._idf[self._indices[:self._size]]
+            squares = np.bincount(self._owners[:self._size], weights=weighted * weighted, minlength=len(self.keys))
+            self._norms[:len(self.keys)] = np.sqrt(squares)
+            self._changes = 0
+        return self._idf, self._norms[:len(self.keys)]
+
+    def search(self, text: str, top_k: int = 10):
+        """Returns up to ``top_k`` (key, score) pairs by descending cosine similarity; zero scores are left out."""
+        if top_k <= 0:
+            return []
+        indices, values = hashed_terms(text, self.n_features)
+        with self._lock:
+            if not self.keys:
+                return []
+            idf, norms = self._weights()
+            query = np.zeros(self.n_features, dtype=np.float32)
+            query[indices] = values * idf[indices]
+            query_norm = np.linalg.norm(query)
+            if query_norm == 0:
+                return []
+
+            weights = self._values[:self._size] * (query * idf)[self._indices[:self._size]]
+            scores = np.bincount(self._owners[:self._size], weights=weights, minlength=len(self.keys))
+            np.divide(scores, norms * query_norm, out=scores, where=norms > 0)
+
+            top_k = min(top_k, len(scores))
+            candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+            ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+            return [(self.keys[row], float(scores[row])) for row in ranked if scores[row] > 0]
+
+    def stats(self):
+        return {
+            "documents": len(self.keys),
+            "features": self.n_features,
+            "entries": self._size - self._dead,
+            "memory_bytes": (
+                self._indices.nbytes + self._values.nbytes + self._owners.nbytes
+                + self._df.nbytes + self._norms.nbytes
+            ),
+        }
+
+
+def rank_documents(query: str, documents: list[str], top_k: int = 10, n_features: int = 4096):
+    """Ranks ad hoc ``documents`` against ``query``; returns (index, score) pairs."""
+    index = TfidfIndex(n_features, initial_capacity=max(1, len(documents)))
+    for position, document in enumerate(documents):
+        index.add(position, document)
+    return index.search(query, top_k)
+
+
+def profile_text(profile):
+    """The parts of a user profile that describe the candidate, joined for indexing."""
+    return "\n".join(part for part in (profile["education"], profile["work_history"]) if part)
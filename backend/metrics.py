@@ -0,0 +1,178 @@
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter as _Counts
+from contextlib import contextmanager
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+TOKEN_BUCKETS = (16, 64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384)
+
+# Metrics are per process: with several uvicorn workers each serves its own /metrics
+REGISTRY = []
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _label_text(labelnames, values):
+    if not labelnames:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)) + "}"
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def observe(self, value: float, **labels):
+        key = tuple(labels[name] for name in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            index = bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted(self._series.items())
+            for key, (counts, total, count) in series:
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    labels = _label_text(self.labelnames + ("le",), key + (repr(float(bound)),))
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _label_text(self.labelnames + ("le",), key + ("+Inf",))
+                lines.append(f"{self.name}_bucket{labels} {count}")
+                lines.append(f"{self.name}_sum{_label_text(self.labelnames, key)} {total}")
+                lines.append(f"{self.name}_count{_label_text(self.labelnames, key)} {count}")
+        return lines
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(labels[name] for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_label_text(self.labelnames, key)} {value}")
+        return lines
+
+
+def render():
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Time until the response starts, by route template",
+    ("method", "route", "status"),
+)
+STAGE_SECONDS = Histogram(
+    "stage_duration_seconds",
+    "Time spent in one stage of request handling (pdf_extract, parse_resume, extract_json)",
+    ("stage",),
+)
+DB_QUERY_SECONDS = Histogram("db_query_duration_seconds", "Database call time, by method", ("method",))
+DB_POOL_WAIT_SECONDS = Histogram("db_pool_wait_seconds", "Time spent waiting for a pooled connection")
+LLM_QUEUE_WAIT_SECONDS = Histogram(
+    "llm_queue_wait_seconds", "Time an LLM call waited for a concurrency slot", ("mode",)
+)
+LLM_UPSTREAM_SECONDS = Histogram(
+    "llm_upstream_duration_seconds", "Time per upstream LLM attempt, by outcome", ("mode", "outcome")
+)
+LLM_TOKENS = Histogram(
+    "llm_tokens", "Tokens per LLM call as reported by the upstream", ("kind",), buckets=TOKEN_BUCKETS
+)
+LLM_RETRIES = Counter("llm_retries_total", "LLM attempts that were retried", ("mode",))
+
+
+def instrument_database(database):
+    """Times the query methods of a ``databases.Database`` instance."""
+    for method in ("execute", "execute_many", "fetch_all", "fetch_one", "fetch_val"):
+        original = getattr(database, method)
+        if getattr(original, "_instrumented", False):
+            continue
+
+        async def timed(*args, _original=original, _method=method, **kwargs):
+            with DB_QUERY_SECONDS.time(method=_method):
+                return await _original(*args, **kwargs)
+
+        timed._instrumented = True
+        setattr(database, method, timed)
+
+
+class SamplingProfiler:
+    """Samples one thread's Python stack on a timer and aggregates the samples as folded stacks.
+
+    The output ("frame;frame;frame count" per line) loads directly into
+    flamegraph.pl or speedscope. Everything running on the sampled thread is
+    captured, so on the event loop thread other concurrent requests show up too.
+    """
+
+    def __init__(self, thread_id: int | None = None, interval: float = 0.005):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.samples = _Counts()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def folded(self):
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
@@ -0,0 +1,170 @@
+import asyncio
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+
+import pdfplumber
+
+from backend.metrics import STAGE_SECONDS
+
+READ_CHUNK_BYTES = 64 * 1024
+
+
+class PDFTooLarge(Exception):
+    pass
+
+
+class PDFPoolSaturated(Exception):
+    pass
+
+
+def iter_page_text(pdf):
+    for page in pdf.pages:
+        yield page.extract_text() or ""
+        # Drop the parsed layout objects as soon as the page's text is out
+        page.flush_cache()
+
+
+def extract_pdf_text(source, max_pages: int | None = None):
+    """Extracts text from a PDF given as bytes or a file path. Runs in a worker process."""
+    with pdfplumber.open(BytesIO(source) if isinstance(source, bytes) else source) as pdf:
+        if max_pages is not None and len(pdf.pages) > max_pages:
+            raise PDFTooLarge(f"PDF has {len(pdf.pages)} pages; the limit is {max_pages}")
+        return "\n".join(iter_page_text(pdf))
+
+
+class PDFExtractor:
+    """Runs PDF text extraction in a bounded process pool so parsing never blocks the event loop.
+
+    Uploads are read in chunks and spill to a temp file past ``spool_bytes``.
+    Once ``max_pending`` extractions are queued or running, new ones are
+    rejected with PDFPoolSaturated instead of piling up.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_pending: int = 4,
+        max_bytes: int = 10 * 1024 * 1024,
+        max_pages: int = 20,
+        spool_bytes: int = 1024 * 1024,
+        timeout: float = 30.0,
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_bytes = max_bytes
+        self.max_pages = max_pages
+        self.spool_bytes = spool_bytes
+        self.timeout = timeout
+        self.pending = 0
+        self.rejected = 0
+        self._executor = None
+
+    @classmethod
+    def from_env(cls):
+        workers = int(os.getenv("PDF_WORKERS", str(min(4, os.cpu_count() or 1))))
+        return cls(
+            workers=workers,
+            max_pending=int(os.getenv("PDF_MAX_PENDING", str(workers * 2))),
+            max_bytes=int(os.getenv("PDF_MAX_BYTES", str(10 * 1024 * 1024))),
+            max_pages=int(os.getenv("PDF_MAX_PAGES", "20")),
+            timeout=float(os.getenv("PDF_TIMEOUT", "30")),
+        )
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def extract(self, upload):
+        """Extracts text from a Starlette UploadFile."""
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise PDFPoolSaturated("PDF extraction is at capacity, retry shortly")
+        if upload.size is not None and upload.size > self.max_bytes:
+            raise PDFTooLarge(f"PDF is larger than {self.max_bytes} bytes")
+
+        self.pending += 1
+        try:
+            source = await self._spool(upload)
+        except BaseException:
+            self.pending -= 1
+            raise
+        path = None if isinstance(source, bytes) else source
+
+        try:
+            future = self.executor.submit(extract_pdf_text, source, self.max_pages)
+        except BaseException as e:
+            self._release(path)
+            if isinstance(e, BrokenProcessPool):
+                self.shutdown()
+            raise
+        # The slot is held until the worker is done, not just until we stop waiting,
+        # so extractions still running after a timeout keep counting towards max_pending
+        future.add_done_callback(self._release_when_done(asyncio.get_running_loop(), path))
+
+        try:
+            with STAGE_SECONDS.time(stage="pdf_extract"):
+                return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout)
+        except BrokenProcessPool:
+            # A worker died (e.g. a PDF crashed the parser); start a fresh pool for the next upload
+            self.shutdown()
+            raise
+
+    def _release(self, path):
+        self.pending -= 1
+        if path:
+            os.unlink(path)
+
+    def _release_when_done(self, loop, path):
+        def callback(_future):
+            # Runs on the executor's thread; hand the release back to the event loop
+            try:
+                loop.call_soon_threadsafe(self._release, path)
+            except RuntimeError:
+                # The loop is already closed (shutdown), nothing else will touch the counter
+                self._release(path)
+        return callback
+
+    async def _spool(self, upload):
+        """Returns the upload as bytes, or as a temp file path once it outgrows spool_bytes."""
+        chunks, size, spill = [], 0, None
+        try:
+            while chunk := await upload.read(READ_CHUNK_BYTES):
+                size += len(chunk)
+                if size > self.max_bytes:
+                    raise PDFTooLarge(f"PDF is larger than {self.max_bytes} bytes")
+                if spill is None and size > self.spool_bytes:
+                    spill = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
+                    spill.write(b"".join(chunks))
+                    chunks = None
+                if spill is None:
+                    chunks.append(chunk)
+                else:
+                    spill.write(chunk)
+        except BaseException:
+            if spill is not None:
+                spill.close()
+                os.unlink(spill.name)
+            raise
+
+        if spill is None:
+            return b"".join(chunks)
+        spill.close()
+        return spill.name
+
+    def stats(self):
+        return {
+            "workers": self.workers,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "rejected": self.rejected,
+        }
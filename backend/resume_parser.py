@@ -0,0 +1,153 @@
+import re
+from bisect import bisect_right
+
+SECTION_HEADERS = r'(education|work experience|professional experience|experience|employment history|skills|projects|certifications|contact information|summary)'
+EDUCATION_KEYWORDS = r'(bachelor|master|ph\.d|degree|university|college)'
+ROLE_KEYWORDS = r'(engineer|developer|manager|analyst|consultant|intern|researcher|scientist|technician|designer)'
+
+# Case-insensitive alternations are slow in `re`, so documents are lowercased once and matched
+# with the case-sensitive form. That is only equivalent to re.I when lowercasing keeps offsets and
+# none of the four non-ASCII letters re.I folds onto ASCII appear; otherwise re.I is used as-is.
+SECTION_HEADER = (re.compile(SECTION_HEADERS), re.compile(SECTION_HEADERS, re.I))
+EDUCATION_KEYWORD = (re.compile(EDUCATION_KEYWORDS), re.compile(EDUCATION_KEYWORDS, re.I))
+ROLE_KEYWORD = (re.compile(ROLE_KEYWORDS), re.compile(ROLE_KEYWORDS, re.I))
+EMAIL = re.compile(r'[\w\.-]+@[\w\.-]+')
+PHONE = re.compile(r'(\+?\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?){1,2}\d{4}')
+NEWLINE = re.compile(r'\n')
+ASCII_FOLDING = re.compile('[\u0130\u0131\u017f\u212a]')
+
+# Section used for work history, in order of preference
+EXPERIENCE_SECTIONS = ('work experience', 'professional experience', 'experience')
+
+
+class ResumeDocument:
+    """A resume tokenized once into line offsets, with the position of every section header.
+
+    Sections are never copied out of the text: keyword patterns run over a
+    section's span in one pass and matches are mapped back to line numbers.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        lowered = text.lower()
+        if len(lowered) == len(text) and not ASCII_FOLDING.search(text):
+            self._search_text, self._case = lowered, 0
+        else:
+            self._search_text, self._case = text, 1
+        self.line_starts = [0] + [m.end() for m in NEWLINE.finditer(text)]
+        self.headers = [
+            (m.start(), m.group().lower())
+            for m in SECTION_HEADER[self._case].finditer(self._search_text)
+        ]
+
+    def section_spans(self):
+        """Maps each header to its (start, end) span; a repeated header keeps its last span."""
+        spans = {}
+        for i, (start, header) in enumerate(self.headers):
+            end = self.headers[i+1][0] if i+1 < len(self.headers) else len(self.text)
+            spans[header] = (start, end)
+        return spans
+
+    def _strip(self, start: int, end: int):
+        text = self.text
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end-1].isspace():
+            end -= 1
+        return start, end
+
+    def _line_index(self, offset: int):
+        return bisect_right(self.line_starts, offset) - 1
+
+    def _line(self, index: int, start: int, end: int):
+        """Line ``index`` clipped to the span [start, end)."""
+        line_start = max(self.line_starts[index], start)
+        line_end = self.line_starts[index+1] - 1 if index+1 < len(self.line_starts) else len(self.text)
+        return self.text[line_start:min(line_end, end)]
+
+    def _matching_lines(self, patterns, start: int, end: int):
+        lines = []
+        for match in patterns[self._case].finditer(self._search_text, start, end):
+            index = self._line_index(match.start())
+            if not lines or lines[-1] != index:
+                lines.append(index)
+        return lines
+
+    def education(self, start: int, end: int):
+        start, end = self._strip(start, end)
+        return "\n".join(
+            self._line(index, start, end).strip()
+            for index in self._matching_lines(EDUCATION_KEYWORD, start, end)
+        )
+
+    def work_experience(self, start: int, end: int):
+        """Joins a one-line-before, two-lines-after window around each role line, merging overlaps."""
+        start, end = self._strip(start, end)
+        if start >= end:
+            return ""
+        first, last = self._line_index(start), self._line_index(end - 1)
+        windows = []
+        for index in self._matching_lines(ROLE_KEYWORD, start, end):
+            low, high = max(first, index-1), min(last+1, index+3)
+            if windows and low < windows[-1][1]:
+                windows[-1][1] = high
+            else:
+                windows.append([low, high])
+        return "\n\n".join(
+            "\n".join(self._line(index, start, end) for index in range(low, high)).strip()
+            for low, high in windows
+        )
+
+
+def split_sections(text: str):
+    document = ResumeDocument(text)
+    return {header: text[start:end].strip() for header, (start, end) in document.section_spans().items()}
+
+
+def extract_contact_info(text: str):
+    email = EMAIL.search(text)
+    phone = PHONE.search(text)
+    return {
+        "email": email.group() if email else None,
+        "phone": phone.group() if phone else None
+    }
+
+
+def extract_education(text: str):
+    return ResumeDocument(text).education(0, len(text))
+
+
+def extract_work_experience(text: str):
+    return ResumeDocument(text).work_experience(0, len(text))
+
+
+def extract_name(text: str):
+    lines = text.strip().split("\n")
+    for line in lines[:5]:
+        clean = line.strip()
+        if len(clean.split()) >= 2 and all(w[0].isupper() for w in clean.split() if w[0].isalpha()):
+            return clean
+    return None
+
+
+def parse_resume(text: str):
+    document = ResumeDocument(text)
+    spans = document.section_spans()
+    contact_info = extract_contact_info(text)
+
+    education = ""
+    if 'education' in spans:
+        education = document.education(*spans['education'])
+
+    work_history = ""
+    experience = next((spans[name] for name in EXPERIENCE_SECTIONS if name in spans), None)
+    if experience:
+        work_history = document.work_experience(*experience)
+
+    return {
+        "full_name": extract_name(text),
+        "email": contact_info["email"],
+        "phone": contact_info["phone"],
+        "education": education,
+        "work_history": work_history
+    }
@@ -0,0 +1,54 @@
+import json
+import re
+
+from backend.json_extract import ANALYSIS_SCHEMA, JSONStreamExtractor
+
+_MATCH_SCORE = re.compile(r'"match_score"\s*:\s*(-?\d+(?:\.\d+)?)\s*[,}\s]')
+
+
+def sse_event(event: str, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class AnalysisStreamParser:
+    """Feeds streamed model output through a JSONStreamExtractor.
+
+    match_score is reported as soon as it appears inside the JSON answer that
+    is being streamed, before the rest of the object has arrived.
+    """
+
+    def __init__(self):
+        self.extractor = JSONStreamExtractor(schema=ANALYSIS_SCHEMA)
+        self.match_score = None
+        self._search_from = 0
+
+    @property
+    def text(self):
+        return self.extractor.buffer
+
+    @property
+    def result(self):
+        return self.extractor.result
+
+    def feed(self, chunk: str):
+        """Returns the match score the first time it can be read, otherwise None."""
+        self.extractor.feed(chunk)
+        if self.match_score is not None:
+            return None
+
+        if self.extractor.result is not None:
+            self.match_score = self.extractor.result["match_score"]
+            return self.match_score
+
+        span_start = self.extractor.span_start
+        if span_start is None:
+            return None
+        match = _MATCH_SCORE.search(self.extractor.text(max(span_start, self._search_from)))
+        if match is None:
+            # Keep a tail in case the key is split across chunks
+            self._search_from = max(span_start, len(self.extractor) - 64)
+            return None
+
+        value = float(match.group(1))
+        self.match_score = int(value) if value.is_integer() else value
+        return self.match_score
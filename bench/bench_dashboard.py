@@ -0,0 +1,113 @@
+"""Benchmark: dashboard query latency as the applications table grows.
+
+Seeds the applications table (rows for ``bench-*`` users, removed afterwards)
+up to each size and times what GET /api/dashboard and POST
+/api/dashboard/update run: a first page with per-status counts, a
+status-filtered page, a deep page reached by following cursors for one heavy
+user, and a single-row status update. Needs DATABASE_URL and the tables from
+create_tables.py.
+
+    python -m bench.bench_dashboard [--sizes 10000,100000,300000] [--users 1000]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+
+from backend.applications import STATUSES, load_dashboard, status_update_query
+from bench.bench_upload import percentile
+from bench.fixtures import COMPANIES, ROLES
+from database import database
+from models import applications
+
+HEAVY_USER = "bench-heavy@example.com"
+INSERT_BATCH = 2000
+
+
+def user_email(index: int):
+    return f"bench-{index}@example.com"
+
+
+async def seed(rng: random.Random, count: int, users: int):
+    now = datetime.now(timezone.utc)
+    rows = []
+    for _ in range(count):
+        updated_at = now - timedelta(seconds=rng.randint(0, 365 * 24 * 3600))
+        rows.append({
+            # Every 20th row belongs to one user so deep pagination has something to page through
+            "user_email": HEAVY_USER if rng.random() < 0.05 else user_email(rng.randrange(users)),
+            "company": rng.choice(COMPANIES),
+            "role": rng.choice(ROLES),
+            "status": rng.choice(STATUSES),
+            "created_at": updated_at,
+            "updated_at": updated_at,
+        })
+    for start in range(0, len(rows), INSERT_BATCH):
+        await database.execute(applications.insert().values(rows[start:start + INSERT_BATCH]))
+    await database.execute(text("ANALYZE applications"))
+
+
+async def timed(fn, repeat: int):
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        latencies.append(time.perf_counter() - started)
+    return statistics.median(latencies) * 1000, percentile(latencies, 99) * 1000
+
+
+async def measure(rng: random.Random, users: int, repeat: int, depth: int):
+    results = {}
+    results["first page"] = await timed(lambda: load_dashboard(database, user_email(rng.randrange(users))), repeat)
+    results["status filter"] = await timed(
+        lambda: load_dashboard(database, user_email(rng.randrange(users)), status=rng.choice(STATUSES)), repeat
+    )
+
+    cursor = None
+    for _ in range(depth):
+        page = await load_dashboard(database, HEAVY_USER, limit=50, cursor=cursor)
+        cursor = page["next_cursor"] or cursor
+    results[f"heavy user, page {depth + 1}"] = await timed(
+        lambda: load_dashboard(database, HEAVY_USER, limit=50, cursor=cursor), repeat
+    )
+
+    ids = [row["id"] for row in await database.fetch_all(
+        applications.select().with_only_columns(applications.c.id)
+        .where(applications.c.user_email.like("bench-%")).limit(repeat)
+    )]
+    targets = iter(ids * 2)
+    results["status update"] = await timed(
+        lambda: database.fetch_one(status_update_query(next(targets), rng.choice(STATUSES))), len(ids)
+    )
+    return results
+
+
+async def main(args):
+    rng = random.Random(7)
+    await database.connect()
+    await database.execute(applications.delete().where(applications.c.user_email.like("bench-%")))
+    try:
+        seeded = 0
+        print(f"{'rows':>8} {'query':>24} {'p50 ms':>8} {'p99 ms':>8}")
+        for size in args.sizes:
+            await seed(rng, size - seeded, args.users)
+            seeded = size
+            for name, (p50, p99) in (await measure(rng, args.users, args.repeat, args.depth)).items():
+                print(f"{size:8d} {name:>24} {p50:8.2f} {p99:8.2f}")
+    finally:
+        await database.execute(applications.delete().where(applications.c.user_email.like("bench-%")))
+        await database.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=lambda value: [int(size) for size in value.split(",")],
+                        default=[10000, 100000, 300000])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--depth", type=int, default=40)
+    asyncio.run(main(parser.parse_args()))
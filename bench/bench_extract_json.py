@@ -0,0 +1,118 @@
+"""Micro-benchmark: JSON extraction from long reasoning-model outputs.
+
+Compares the original brace-pair scan with the single-pass scanner on the
+whole output and fed in streamed chunks. extract_json is also timed, but it
+skips straight to the last </think>, so speedups are reported against the
+scanner, and an "untagged" variant without <think> tags makes every path
+scan the reasoning.
+
+    python -m bench.bench_extract_json [--sizes 4000 16000 64000] [--repeat 5]
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+
+from backend.json_extract import JSONStreamExtractor, extract_json
+
+ANSWER = {"match_score": 78, "suggestions": ["Lead with Python impact", "Add {AWS} certifications", "Trim the summary"]}
+
+REASONING_SNIPPETS = [
+    "The candidate lists {Python, SQL, Airflow} which overlaps with the posting's {Python, Spark}.",
+    "If I weigh it like `score = {skills: 0.5, experience: 0.3, education: 0.2}` the total lands near 80.",
+    "Something like {\"match_score\": 80 might be right, but the suggestions need more thought.",
+    "For example: def fit(r, jd) { return overlap(r, jd) / len(jd) } gives a rough baseline.",
+    "They wrote \"built {internal} tools\" which is vague; a JSON field like {\"impact\": ?} would help.",
+    "Set notation {a | a in resume and a in jd} covers about two thirds of the requirements.",
+    "Their latest role ended in 2023 and the gap isn't explained anywhere.",
+]
+
+
+def model_output(size: int, seed: int = 0, tagged: bool = True):
+    """A synthetic DeepSeek-R1 style reply: long reasoning full of braces, then the answer.
+
+    With ``tagged`` the reasoning is wrapped in <think> tags; without, it is plain prose.
+    """
+    rng = random.Random(seed)
+    parts = ["<think>\n" if tagged else ""]
+    length = 0
+    while length < size:
+        snippet = rng.choice(REASONING_SNIPPETS)
+        parts.append(snippet + ("\n\n" if rng.random() < 0.2 else " "))
+        length += len(snippet) + 1
+    parts.append("\n</think>\n\n" if tagged else "\n\nFinal answer:\n")
+    parts.append(json.dumps(ANSWER, indent=2))
+    return "".join(parts)
+
+
+def legacy_extract_json(text: str):
+    start = text.find('{')
+    while start != -1:
+        end = text.find('}', start)
+        while end != -1:
+            candidate = text[start:end+1]
+            try:
+                json.loads(candidate)
+                return candidate
+            except json.JSONDecodeError:
+                end = text.find('}', end+1)
+        start = text.find('{', start+1)
+    return None
+
+
+def scan_extract_json(text: str):
+    extractor = JSONStreamExtractor()
+    extractor.feed(text)
+    return extractor.close()
+
+
+def streamed_extract_json(text: str, chunk_size: int = 16):
+    extractor = JSONStreamExtractor()
+    for start in range(0, len(text), chunk_size):
+        extractor.feed(text[start:start + chunk_size])
+    return extractor.close()
+
+
+def timed(fn, text: str, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(text)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4000, 16000, 64000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--legacy-max-size", type=int, default=64000, help="skip the legacy scan above this size")
+    args = parser.parse_args()
+
+    print(
+        f"{'input':>9} {'chars':>7} {'legacy ms':>10} {'extract_json ms':>16} "
+        f"{'scan ms':>8} {'streamed ms':>12} {'scan speedup':>13}"
+    )
+    for size in args.sizes:
+        for label, tagged in (("tagged", True), ("untagged", False)):
+            text = model_output(size, tagged=tagged)
+            assert extract_json(text) == ANSWER
+            assert scan_extract_json(text) == ANSWER
+            assert streamed_extract_json(text) == ANSWER
+
+            new = timed(extract_json, text, args.repeat)
+            scan = timed(scan_extract_json, text, args.repeat)
+            streamed = timed(streamed_extract_json, text, args.repeat)
+            if size <= args.legacy_max_size:
+                legacy = timed(legacy_extract_json, text, max(1, args.repeat // 5))
+                legacy_ms, speedup = f"{legacy * 1000:10.1f}", f"{legacy / scan:12.0f}x"
+            else:
+                legacy_ms, speedup = f"{'skipped':>10}", f"{'-':>13}"
+            print(
+                f"{label:>9} {len(text):7d} {legacy_ms} {new * 1000:16.2f} "
+                f"{scan * 1000:8.2f} {streamed * 1000:12.2f} {speedup}"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark: bulk resume ingestion throughput in resumes/sec.
+
+Generates a zip of fixture PDFs and runs ResumeIngestor over it. Parsing only
+by default; with --database the rows are written to DATABASE_URL as well and
+one-row-per-statement writes (how /api/resume/upload works) are measured
+against batched upserts.
+
+    python -m bench.bench_ingest [--resumes 500] [--workers 4] [--database]
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import zipfile
+
+from backend.ingest import ResumeIngestor
+from bench.fixtures import resume_pdf
+
+
+def build_archive(path: str, count: int):
+    with zipfile.ZipFile(path, "w") as archive:
+        for seed in range(count):
+            archive.writestr(f"resumes/resume_{seed:05d}.pdf", resume_pdf(seed))
+
+
+async def run(path: str, database, workers: int, batch_size: int):
+    ingestor = ResumeIngestor(database, workers=workers, batch_size=batch_size)
+    try:
+        progress = await ingestor.ingest(path)
+    finally:
+        ingestor.shutdown()
+    return progress
+
+
+async def main(args):
+    database = None
+    if args.database:
+        from database import database
+        await database.connect()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "resumes.zip")
+        build_archive(path, args.resumes)
+
+        print(f"{args.resumes} resumes, {args.workers} workers")
+        print(f"{'mode':>22} {'seconds':>8} {'resumes/s':>10} {'failed':>7}")
+        modes = [("parse only", None, args.batch_size)]
+        if database is not None:
+            modes = [
+                ("row-at-a-time writes", database, 1),
+                (f"batched writes ({args.batch_size})", database, args.batch_size),
+            ]
+        for label, target, batch_size in modes:
+            progress = await run(path, target, args.workers, batch_size)
+            print(f"{label:>22} {progress.elapsed:8.2f} {progress.parsed / progress.elapsed:10.1f} {progress.failed:7d}")
+
+    if database is not None:
+        await database.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--database", action="store_true", help="also write to DATABASE_URL")
+    asyncio.run(main(parser.parse_args()))
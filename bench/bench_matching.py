@@ -0,0 +1,63 @@
+"""Benchmark: local TF-IDF pre-scoring — indexing rate and top-K query latency.
+
+Indexes fixture resumes the way /api/match/resumes does (profile text keyed
+by email), then times job-description queries against the index and ranking
+one resume against a list of job descriptions as /api/match/jobs does.
+
+    python -m bench.bench_matching [--resumes 10000] [--queries 200] [--jobs 500]
+"""
+import argparse
+import statistics
+import time
+
+from backend.matching import TfidfIndex, profile_text, rank_documents
+from backend.resume_parser import parse_resume
+from bench.bench_upload import percentile
+from bench.fixtures import make_job_description, make_resume
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--features", type=int, default=4096)
+    args = parser.parse_args()
+
+    profiles = [parse_resume(make_resume(seed)) for seed in range(args.resumes)]
+    index = TfidfIndex(args.features)
+    started = time.perf_counter()
+    for profile in profiles:
+        index.add(profile["email"], profile_text(profile))
+    elapsed = time.perf_counter() - started
+    stats = index.stats()
+    print(
+        f"indexed {stats['documents']} resumes in {elapsed:.2f}s "
+        f"({stats['documents'] / elapsed:.0f}/s, {stats['memory_bytes'] / 1e6:.0f} MB)"
+    )
+
+    job_descriptions = [make_job_description(seed) for seed in range(max(args.queries, args.jobs))]
+    latencies = []
+    for job_description in job_descriptions[:args.queries]:
+        started = time.perf_counter()
+        index.search(job_description, args.top_k)
+        latencies.append(time.perf_counter() - started)
+    print(
+        f"top-{args.top_k} resumes per job description: p50 {statistics.median(latencies) * 1000:.2f} ms, "
+        f"p99 {percentile(latencies, 99) * 1000:.2f} ms"
+    )
+
+    latencies = []
+    for seed in range(args.queries):
+        started = time.perf_counter()
+        rank_documents(make_resume(seed), job_descriptions[:args.jobs], args.top_k, args.features)
+        latencies.append(time.perf_counter() - started)
+    print(
+        f"top-{args.top_k} of {args.jobs} job descriptions per resume: "
+        f"p50 {statistics.median(latencies) * 1000:.2f} ms, p99 {percentile(latencies, 99) * 1000:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
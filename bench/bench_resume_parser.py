@@ -0,0 +1,34 @@
+"""Benchmark: the resume section parser against the original per-line regex parser.
+
+The reference parser and the noisy corpus live in tests/test_resume_parser.py,
+which also checks that both produce the same output.
+
+    python -m bench.bench_resume_parser [--documents 2000] [--repeat 3]
+"""
+import argparse
+import time
+
+from backend.resume_parser import parse_resume
+from tests.test_resume_parser import legacy_parse_resume, noisy_resume
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    documents = [noisy_resume(seed) for seed in range(args.documents)]
+    for name, fn in (("legacy", legacy_parse_resume), ("single-pass", parse_resume)):
+        best = None
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            for text in documents:
+                fn(text)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{name:>12}: {best * 1000:8.1f} ms total, {len(documents) / best:8.0f} resumes/s")
+
+
+if __name__ == "__main__":
+    main()
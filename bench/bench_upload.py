@@ -0,0 +1,107 @@
+"""Benchmark: event-loop latency of lightweight requests during a burst of PDF uploads.
+
+Extraction runs either inline in the event loop (how /api/resume/upload used
+to work) or through the PDFExtractor process pool, while a steady stream of
+requests hits a /api/dashboard-style endpoint in the same loop.
+
+    python -m bench.bench_upload [--uploads 16] [--pages 8] [--workers 4]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from io import BytesIO
+
+import httpx
+import pdfplumber
+from fastapi import FastAPI
+from starlette.datastructures import UploadFile
+
+from backend.pdf_extract import PDFExtractor, PDFPoolSaturated
+from bench.fixtures import resume_pdf
+
+probe_app = FastAPI()
+
+
+@probe_app.get("/api/dashboard")
+def dashboard():
+    return {"applications": []}
+
+
+async def extract_inline(pdf_bytes: bytes):
+    with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+        return "\n".join([page.extract_text() or "" for page in pdf.pages])
+
+
+async def extract_pooled(extractor: PDFExtractor, pdf_bytes: bytes):
+    while True:
+        upload = UploadFile(file=BytesIO(pdf_bytes), size=len(pdf_bytes), filename="resume.pdf")
+        try:
+            return await extractor.extract(upload)
+        except PDFPoolSaturated:
+            # What a well-behaved client does with the 503 + Retry-After
+            await asyncio.sleep(0.05)
+
+
+async def probe(client: httpx.AsyncClient, stop: asyncio.Event, latencies: list):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get("/api/dashboard")
+        latencies.append(time.perf_counter() - started)
+        await asyncio.sleep(0.005)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run(mode: str, pdfs: list, workers: int):
+    extractor = PDFExtractor(workers=workers, max_pending=workers * 2, max_pages=1000)
+    if mode == "pool":
+        # Start the workers up front so process spawn time is not measured
+        await asyncio.gather(*[extract_pooled(extractor, pdfs[0]) for _ in range(workers)])
+
+    latencies, stop = [], asyncio.Event()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=probe_app), base_url="http://bench") as client:
+        probe_task = asyncio.create_task(probe(client, stop, latencies))
+        started = time.perf_counter()
+        if mode == "inline":
+            await asyncio.gather(*[extract_inline(pdf) for pdf in pdfs])
+        else:
+            await asyncio.gather(*[extract_pooled(extractor, pdf) for pdf in pdfs])
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await probe_task
+    extractor.shutdown()
+
+    return {
+        "mode": mode,
+        "burst_seconds": elapsed,
+        "probe_requests": len(latencies),
+        "probe_p50_ms": statistics.median(latencies) * 1000,
+        "probe_p99_ms": percentile(latencies, 99) * 1000,
+        "probe_max_ms": max(latencies) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uploads", type=int, default=16)
+    parser.add_argument("--pages", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    pdfs = [resume_pdf(seed, pages=args.pages) for seed in range(args.uploads)]
+    print(f"{args.uploads} uploads x {args.pages} pages, {args.workers} pool workers")
+    print(f"{'mode':>8} {'burst s':>8} {'probes':>7} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for mode in ("inline", "pool"):
+        r = asyncio.run(run(mode, pdfs, args.workers))
+        print(
+            f"{r['mode']:>8} {r['burst_seconds']:8.2f} {r['probe_requests']:7d} "
+            f"{r['probe_p50_ms']:8.1f} {r['probe_p99_ms']:8.1f} {r['probe_max_ms']:8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
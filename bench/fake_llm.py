@@ -0,0 +1,129 @@
+"""Local stand-in for the Azure AI inference chat-completions API.
+
+Run with ``python -m bench.fake_llm --port 9000`` and point the backend at it
+with ``AZURE_OPENAI_API_URL=http://127.0.0.1:9000``.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+
+CANNED_REPLY = {
+    "match_score": 72,
+    "suggestions": ["Quantify impact in recent roles", "Mention the required cloud stack", "Tighten the summary"],
+}
+
+config = {
+    "latency": float(os.getenv("FAKE_LLM_LATENCY", "0.5")),
+    "error_rate": float(os.getenv("FAKE_LLM_ERROR_RATE", "0")),
+    # Streamed tokens per second; each token is roughly four characters
+    "token_rate": float(os.getenv("FAKE_LLM_TOKEN_RATE", "50")),
+    # Retry-After sent with scripted and random 429/503 errors
+    "retry_after": "0",
+}
+
+# Scripted outcomes for tests, one per request: an HTTP error status, "malformed" (a 200 whose
+# body is not JSON) or "bad_chunk" (a stream that sends one delta, then a chunk that is not an object)
+script = []
+stats = {"requests": 0, "in_flight": 0, "max_in_flight": 0}
+
+app = FastAPI()
+
+
+BATCH_JOB = re.compile(r'^Job Description (\d+):', re.M)
+
+
+def reply_text(prompt: str):
+    jobs = len(BATCH_JOB.findall(prompt))
+    if jobs:
+        answer = [{"job": number, **CANNED_REPLY} for number in range(1, jobs + 1)]
+    else:
+        answer = CANNED_REPLY
+    return "<think>\nScoring the resume against the posting.\n</think>\n\n" + json.dumps(answer)
+
+
+async def stream_chunks(content: str, model: str | None, bad_chunk: bool = False):
+    delay = 1 / config["token_rate"] if config["token_rate"] > 0 else 0
+    for start in range(0, len(content), 4):
+        if bad_chunk and start:
+            yield "data: [1, 2]\n\n"
+            return
+        chunk = {
+            "id": "fake-completion",
+            "object": "chat.completion.chunk",
+            "model": model,
+            "choices": [{"index": 0, "delta": {"content": content[start:start + 4]}, "finish_reason": None}],
+        }
+        yield f"data: {json.dumps(chunk)}\n\n"
+        if delay:
+            await asyncio.sleep(delay)
+    yield "data: [DONE]\n\n"
+
+
+def error_response(status_code: int):
+    headers = {"Retry-After": config["retry_after"]} if status_code in (429, 503) else {}
+    return JSONResponse({"error": {"code": f"Status{status_code}"}}, status_code=status_code, headers=headers)
+
+
+@app.post("/models/chat/completions")
+async def chat_completions(request: Request):
+    stats["requests"] += 1
+    stats["in_flight"] += 1
+    stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+    try:
+        return await complete(await request.json())
+    finally:
+        stats["in_flight"] -= 1
+
+
+async def complete(body: dict):
+    await asyncio.sleep(config["latency"])
+    scripted = script.pop(0) if script else None
+    if isinstance(scripted, int):
+        return error_response(scripted)
+    if scripted == "malformed":
+        return PlainTextResponse("<html>Bad gateway</html>")
+    if random.random() < config["error_rate"]:
+        return error_response(429)
+
+    prompt = body["messages"][-1]["content"]
+    content = reply_text(prompt)
+    if body.get("stream"):
+        return StreamingResponse(
+            stream_chunks(content, body.get("model"), bad_chunk=scripted == "bad_chunk"),
+            media_type="text/event-stream"
+        )
+    # Non-streamed answers still take as long to generate as the streamed ones
+    completion_tokens = len(content) // 4
+    if config["token_rate"] > 0:
+        await asyncio.sleep(completion_tokens / config["token_rate"])
+    return {
+        "id": "fake-completion",
+        "object": "chat.completion",
+        "model": body.get("model"),
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {
+            "prompt_tokens": len(prompt) // 4,
+            "completion_tokens": completion_tokens,
+            "total_tokens": len(prompt) // 4 + completion_tokens,
+        },
+    }
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Fake chat-completions server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency", type=float, default=config["latency"])
+    parser.add_argument("--error-rate", type=float, default=config["error_rate"])
+    parser.add_argument("--token-rate", type=float, default=config["token_rate"])
+    args = parser.parse_args()
+    config.update(latency=args.latency, error_rate=args.error_rate, token_rate=args.token_rate)
+    uvicorn.run(app, host=args.host, port=args.port)
@@ -0,0 +1,121 @@
+"""Deterministic fixture corpus for the benchmarks: resumes, job descriptions and PDFs."""
+import random
+
+FIRST_NAMES = ["Ava", "Liam", "Maya", "Noah", "Priya", "Diego", "Sofia", "Kenji", "Amara", "Lucas"]
+LAST_NAMES = ["Nguyen", "Garcia", "Patel", "Okafor", "Smith", "Tanaka", "Rossi", "Cohen", "Silva", "Kim"]
+COMPANIES = ["OpenAI", "Google", "Amazon", "Meta", "Netflix", "Stripe", "Shopify", "Airbnb", "Datadog", "Atlassian"]
+ROLES = [
+    "Software Engineer", "Data Analyst", "ML Engineer", "Product Manager", "Frontend Developer",
+    "Research Scientist", "Data Engineer", "UX Designer", "Security Consultant", "Support Technician",
+]
+SKILLS = [
+    "Python", "SQL", "React", "TypeScript", "AWS", "Docker", "Kubernetes", "PostgreSQL", "Spark",
+    "Airflow", "PyTorch", "FastAPI", "Go", "Terraform", "Tableau", "Figma", "GraphQL", "Redis",
+]
+DEGREES = [
+    "Bachelor of Science in Computer Science", "Master of Science in Data Science",
+    "Bachelor of Arts in Economics", "Ph.D. in Statistics", "Associate Degree in Design",
+]
+SCHOOLS = ["State University", "Tech College", "University of Somewhere", "City College", "Institute of Technology"]
+DUTIES = [
+    "Built data pipelines processing 2M events per day",
+    "Led migration of the billing service to Kubernetes",
+    "Reduced page load time by 40% through code splitting",
+    "Mentored four junior team members",
+    "Designed dashboards used by the executive team",
+    "Shipped a recommendation feature that raised retention 8%",
+    "Automated weekly reporting with Airflow and SQL",
+    "Partnered with design on a checkout redesign",
+]
+STATUSES = ["Applied", "Interview", "Rejected"]
+
+
+def make_resume(seed: int, jobs: int = 3):
+    rng = random.Random(seed)
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    lines = [
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}{seed}@example.com | ({rng.randint(200, 989)}) {rng.randint(200, 989)}-{rng.randint(1000, 9999)}",
+        "",
+        "Summary",
+        f"{rng.choice(ROLES)} with {rng.randint(2, 15)} years of experience in {', '.join(rng.sample(SKILLS, 3))}.",
+        "",
+        "Work Experience",
+    ]
+    for index in range(jobs):
+        end_year = 2024 - index * 2
+        lines.append(f"{rng.choice(ROLES)}, {rng.choice(COMPANIES)}")
+        lines.append(f"{end_year - 2} - {end_year}")
+        lines.extend(f"- {duty}" for duty in rng.sample(DUTIES, 2))
+    lines += [
+        "",
+        "Education",
+        rng.choice(DEGREES),
+        f"{rng.choice(SCHOOLS)}, {rng.randint(2005, 2020)}",
+        "",
+        "Skills",
+        ", ".join(rng.sample(SKILLS, 6)),
+    ]
+    return "\n".join(lines)
+
+
+def make_job_description(seed: int):
+    rng = random.Random(seed + 1_000_003)
+    role, company = rng.choice(ROLES), rng.choice(COMPANIES)
+    required = rng.sample(SKILLS, 4)
+    return "\n".join([
+        f"{role} at {company}",
+        f"We are hiring a {role.lower()} to join our {rng.choice(['platform', 'growth', 'data', 'payments'])} team.",
+        f"Requirements: {rng.randint(2, 8)}+ years of experience with {', '.join(required)}.",
+        f"Nice to have: {', '.join(rng.sample(SKILLS, 2))}.",
+        f"Responsibilities: {rng.choice(DUTIES).lower()} and {rng.choice(DUTIES).lower()}.",
+    ])
+
+
+def _pdf_escape(line: str):
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(text: str, pages: int = 1, lines_per_page: int = 50):
+    """Builds a minimal text PDF; the text is repeated across ``pages`` pages."""
+    lines = text.split("\n")
+    page_lines = []
+    for page in range(pages):
+        page_lines.append([lines[(page * lines_per_page + i) % len(lines)] for i in range(min(lines_per_page, len(lines)))])
+
+    objects = []
+    font_id = 3
+    page_ids = []
+    next_id = 4
+    for content in page_lines:
+        stream = "BT /F1 11 Tf 14 TL 72 740 Td " + " ".join(f"({_pdf_escape(line)}) Tj T*" for line in content) + " ET"
+        page_id, content_id = next_id, next_id + 1
+        next_id += 2
+        page_ids.append(page_id)
+        objects.append((page_id, (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {content_id} 0 R >>"
+        )))
+        objects.append((content_id, f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream"))
+
+    objects = [
+        (1, "<< /Type /Catalog /Pages 2 0 R >>"),
+        (2, f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {len(page_ids)} >>"),
+        (font_id, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"),
+    ] + objects
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for object_id, body in objects:
+        offsets[object_id] = len(out)
+        out += f"{object_id} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    for object_id in range(1, len(objects) + 1):
+        out += f"{offsets[object_id]:010d} 00000 n \n".encode("latin-1")
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    return bytes(out)
+
+
+def resume_pdf(seed: int, pages: int = 1):
+    return make_pdf(make_resume(seed), pages=pages)
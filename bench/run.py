@@ -0,0 +1,316 @@
+"""Load-test harness: runs scripted scenarios against the API backed by the fake LLM.
+
+Starts bench.fake_llm and the app (uvicorn backend.main:app) as subprocesses,
+drives each scenario with concurrent HTTP clients, and reports p50/p95/p99
+latency, requests/sec and the app's peak RSS. Results are saved as JSON named
+after the git commit so runs can be compared across commits. The app needs
+DATABASE_URL with the tables from create_tables.py.
+
+    python -m bench.run [--scenarios analyze,upload,dashboard,profile] [--requests 200]
+    python -m bench.run --compare bench/results/<commit>.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import httpx
+
+from bench.bench_upload import percentile
+from bench.fixtures import COMPANIES, ROLES, make_job_description, make_resume, resume_pdf
+
+SCENARIOS = ("analyze", "upload", "dashboard", "profile")
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+BENCH_USER = "bench-run@example.com"
+
+
+def git_commit():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return commit + ("-dirty" if dirty else "")
+
+
+def child_pids(pid: int):
+    children = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children") as listing:
+                children.extend(int(child) for child in listing.read().split())
+    except OSError:
+        pass
+    return children
+
+
+def rss_bytes(pid: int):
+    """RSS of ``pid`` plus all its descendants (PDF and ingest worker processes), or None if it is gone."""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            rss = next(int(line.split()[1]) * 1024 for line in status if line.startswith("VmRSS:"))
+    except (OSError, StopIteration):
+        return None
+    return rss + sum(rss_bytes(child) or 0 for child in child_pids(pid))
+
+
+def log_tail(path: str, lines: int = 40):
+    with open(path, errors="replace") as log:
+        return "".join(log.readlines()[-lines:])
+
+
+def start_server(args: list[str], env: dict, port: int):
+    # stderr goes to a file: a pipe nobody reads fills up and blocks a chatty server mid-run
+    log_path = os.path.join(tempfile.gettempdir(), f"bench-server-{port}.log")
+    with open(log_path, "w") as log:
+        process = subprocess.Popen(
+            [sys.executable, *args], env={**os.environ, **env}, stdout=subprocess.DEVNULL, stderr=log
+        )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{' '.join(args)} exited; end of {log_path}:\n{log_tail(log_path)}")
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/", timeout=1)
+            return process
+        except httpx.TransportError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"{' '.join(args)} did not start within 30s; end of {log_path}:\n{log_tail(log_path)}")
+
+
+async def send(client: httpx.AsyncClient, make_request):
+    """Sends one request, retrying 503s with Retry-After the way a well-behaved client would.
+
+    Returns the final response and the number of retries.
+    """
+    response, retries = await make_request(client), 0
+    while response.status_code == 503 and "retry-after" in response.headers:
+        retries += 1
+        await asyncio.sleep(min(float(response.headers["retry-after"]), 0.25))
+        response = await make_request(client)
+    return response, retries
+
+
+async def drive(client: httpx.AsyncClient, requests: list, concurrency: int, pid: int):
+    """Sends ``requests`` (callables returning a coroutine) with at most ``concurrency`` in flight.
+
+    Retries after a 503 count towards that request's latency.
+    """
+    latencies, errors, retries, peak_rss = [], 0, 0, rss_bytes(pid) or 0
+    queue = iter(requests)
+
+    async def worker():
+        nonlocal errors, retries
+        for make_request in queue:
+            started = time.perf_counter()
+            try:
+                response, retried = await send(client, make_request)
+                retries += retried
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    async def sample_rss():
+        nonlocal peak_rss
+        while True:
+            peak_rss = max(peak_rss, rss_bytes(pid) or 0)
+            await asyncio.sleep(0.1)
+
+    sampler = asyncio.create_task(sample_rss())
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+    sampler.cancel()
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "retries": retries,
+        "seconds": round(elapsed, 3),
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "peak_rss_mb": round(max(peak_rss, rss_bytes(pid) or 0) / 1e6, 1),
+    }
+
+
+def analyze_requests(count: int):
+    # Distinct pairs, so every request is a cache miss that reaches the LLM
+    return [
+        lambda client, seed=seed: client.post("/api/resume/analyze", json={
+            "resume_text": make_resume(seed), "job_description": make_job_description(seed)
+        })
+        for seed in range(count)
+    ]
+
+
+def upload_requests(count: int, pages: int):
+    pdfs = [resume_pdf(seed, pages=pages) for seed in range(count)]
+    return [
+        lambda client, pdf=pdf: client.post(
+            "/api/resume/upload", files={"file": ("resume.pdf", pdf, "application/pdf")}
+        )
+        for pdf in pdfs
+    ]
+
+
+async def seed_applications(client: httpx.AsyncClient, count: int):
+    existing = (await client.get("/api/dashboard", params={"user_email": BENCH_USER, "limit": 1})).json()
+    have = sum(existing["counts"].values())
+    semaphore = asyncio.Semaphore(16)
+
+    async def create(index: int):
+        async with semaphore:
+            await client.post("/api/dashboard/applications", json={
+                "user_email": BENCH_USER,
+                "company": COMPANIES[index % len(COMPANIES)],
+                "role": ROLES[index % len(ROLES)],
+            })
+
+    await asyncio.gather(*[create(index) for index in range(have, count)])
+
+
+def dashboard_requests(count: int):
+    filters = [{}, {"status": "Applied"}, {"company": COMPANIES[0]}]
+    return [
+        lambda client, index=index: client.get(
+            "/api/dashboard", params={"user_email": BENCH_USER, **filters[index % len(filters)]}
+        )
+        for index in range(count)
+    ]
+
+
+def profile_requests(count: int, emails: list[str]):
+    return [lambda client, index=index: client.get(f"/profile/{emails[index % len(emails)]}") for index in range(count)]
+
+
+async def run_scenarios(args, pid: int):
+    results = {}
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.port}", timeout=120, limits=limits) as client:
+        for name in args.scenarios:
+            if name == "analyze":
+                requests = analyze_requests(args.requests)
+            elif name == "upload":
+                requests = upload_requests(args.requests, args.pages)
+            elif name == "dashboard":
+                await seed_applications(client, args.applications)
+                requests = dashboard_requests(args.requests * 5)
+            else:
+                # Profiles polled by the autofill flow, seeded by uploading a few resumes
+                emails = []
+                for make_request in upload_requests(5, args.pages):
+                    response, _ = await send(client, make_request)
+                    if response.status_code != 200:
+                        raise RuntimeError(f"seeding profiles failed: {response.status_code} {response.text}")
+                    emails.append(response.json()["parsed_data"]["email"])
+                requests = profile_requests(args.requests * 5, emails)
+            results[name] = await drive(client, requests, args.concurrency, pid)
+            print_result(name, results[name])
+    return results
+
+
+def print_result(name: str, result: dict, baseline: dict | None = None):
+    line = (
+        f"{name:>10} {result['requests']:6d} {result['errors']:6d} {result['rps']:8.1f} "
+        f"{result['p50_ms']:8.1f} {result['p95_ms']:8.1f} {result['p99_ms']:8.1f} {result['peak_rss_mb']:8.1f}"
+    )
+    if baseline:
+        changes = []
+        for key in ("rps", "p50_ms", "p99_ms", "peak_rss_mb"):
+            if baseline.get(key):
+                changes.append(f"{key} {(result[key] - baseline[key]) / baseline[key] * 100:+.0f}%")
+        line += "   vs baseline: " + ", ".join(changes)
+    print(line)
+
+
+def print_header():
+    print(f"{'scenario':>10} {'reqs':>6} {'errors':>6} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'rss MB':>8}")
+
+
+def compare(current: dict, baseline: dict):
+    print(f"{current['commit']} vs {baseline['commit']}")
+    print_header()
+    for name, result in current["scenarios"].items():
+        print_result(name, result, baseline["scenarios"].get(name))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", type=lambda value: value.split(","), default=list(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario (x5 for reads)")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--pages", type=int, default=2, help="pages per uploaded PDF")
+    parser.add_argument("--applications", type=int, default=500, help="applications seeded for dashboard reads")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--llm-port", type=int, default=9765)
+    parser.add_argument("--llm-latency", type=float, default=0.3)
+    parser.add_argument("--llm-token-rate", type=float, default=200)
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--output", help="results file (default bench/results/<commit>.json)")
+    parser.add_argument("--compare", help="results file to compare against")
+    parser.add_argument("--compare-only", action="store_true", help="compare --output with --compare without running")
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    commit = git_commit()
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}.json")
+    if args.compare_only:
+        with open(output) as current, open(args.compare) as baseline:
+            compare(json.load(current), json.load(baseline))
+        return
+
+    fake_llm = start_server([
+        "-m", "bench.fake_llm", "--port", str(args.llm_port), "--latency", str(args.llm_latency),
+        "--token-rate", str(args.llm_token_rate), "--error-rate", str(args.llm_error_rate),
+    ], {}, args.llm_port)
+    try:
+        app = start_server(
+            ["-m", "uvicorn", "backend.main:app", "--port", str(args.port), "--log-level", "warning"],
+            {"AZURE_OPENAI_API_URL": f"http://127.0.0.1:{args.llm_port}", "AZURE_DEPLOYMENT_NAME": "bench"},
+            args.port
+        )
+        try:
+            print(f"commit {commit}, {args.concurrency} concurrent clients")
+            print_header()
+            scenarios = asyncio.run(run_scenarios(args, app.pid))
+        finally:
+            app.terminate()
+            app.wait()
+    finally:
+        fake_llm.terminate()
+        fake_llm.wait()
+
+    report = {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "compare", "compare_only")},
+        "scenarios": scenarios,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as results:
+        json.dump(report, results, indent=2)
+    print(f"saved {output}")
+
+    if args.compare:
+        with open(args.compare) as baseline:
+            compare(report, json.load(baseline))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,5 @@
-from database import database, metadata
-from models import user_profiles
-import asyncio
-from sqlalchemy import create_engine
-import os
+from database import get_engine, metadata
+import models  # registers the tables on metadata
 
-DATABASE_URL = os.getenv("DATABASE_URL")
-
-engine = create_engine(DATABASE_URL)
-
-metadata.create_all(engine)
+metadata.create_all(get_engine())
 print("Tables created successfully.")
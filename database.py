@@ -2,15 +2,94 @@ from databases import Database
 from sqlalchemy import MetaData, create_engine
 
 import os
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# Connection pool bounds; keep DB_POOL_MAX_SIZE x uvicorn workers under Postgres' max_connections
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+
 # Async database connection via databases package
-database = Database(DATABASE_URL)
+database = Database(DATABASE_URL, min_size=DB_POOL_MIN_SIZE, max_size=DB_POOL_MAX_SIZE)
 
-# SQLAlchemy engine and metadata for table creation and ORM
-engine = create_engine(DATABASE_URL)
+# Metadata for table creation; the sync engine is only built by scripts that need one
 metadata = MetaData()
+_engine = None
+
+
+def get_engine():
+    global _engine
+    if _engine is None:
+        _engine = create_engine(DATABASE_URL)
+    return _engine
+
+
+def __getattr__(name):
+    # Keeps `from database import engine` working without creating the engine at import
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class PoolStats:
+    """Times how long requests wait to check a connection out of the asyncpg pool."""
+
+    def __init__(self):
+        self.pool = None
+        self.acquisitions = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        # Callables given each wait in seconds, e.g. a histogram's observe
+        self.observers = []
+
+    def instrument(self, database: Database):
+        """Times pool checkouts; call after ``database.connect()``. Backends without a pool are left alone."""
+        pool = getattr(database._backend, "_pool", None)
+        if pool is None or isinstance(pool, _TimedPool):
+            return
+        self.pool = pool
+        database._backend._pool = _TimedPool(pool, self)
+
+    def record(self, seconds: float):
+        self.acquisitions += 1
+        self.wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+        for observer in self.observers:
+            observer(seconds)
+
+    def stats(self):
+        stats = {
+            "min_size": DB_POOL_MIN_SIZE,
+            "max_size": DB_POOL_MAX_SIZE,
+            "acquisitions": self.acquisitions,
+            "avg_wait_ms": round(self.wait_seconds / self.acquisitions * 1000, 3) if self.acquisitions else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+        }
+        if self.pool is not None:
+            stats["size"] = self.pool.get_size()
+            stats["idle"] = self.pool.get_idle_size()
+        return stats
+
+
+class _TimedPool:
+    """Stands in for the asyncpg pool (whose attributes are read-only) and times ``acquire``."""
+
+    def __init__(self, pool, stats: PoolStats):
+        self._pool = pool
+        self._stats = stats
+
+    async def acquire(self, *args, **kwargs):
+        started = time.perf_counter()
+        connection = await self._pool.acquire(*args, **kwargs)
+        self._stats.record(time.perf_counter() - started)
+        return connection
+
+    def __getattr__(self, name):
+        return getattr(self._pool, name)
+
+
+pool_stats = PoolStats()
@@ -1,4 +1,18 @@
 // === Resume & Job Description Analysis ===
+function renderAnalysis(data) {
+  if (Array.isArray(data.suggestions)) {
+    document.getElementById("result").innerHTML = `
+      <h3>Match Score: ${data.match_score}%</h3>
+      <ul>${data.suggestions.map(s => `<li>${s}</li>`).join('')}</ul>
+    `;
+  } else {
+    document.getElementById("result").innerHTML = `
+      <h3>Match Score: ${data.match_score}%</h3>
+      <p>${(data.suggestions || []).join("<br>")}</p>
+    `;
+  }
+}
+
 async function analyze() {
   const resume = document.getElementById("resume").value;
   const jd = document.getElementById("jd").value;
@@ -8,8 +22,12 @@ async function analyze() {
     return;
   }
 
+  const resultEl = document.getElementById("result");
+  resultEl.innerHTML = `<h3>Match Score: …</h3><pre id="analysisStream"></pre>`;
+
   try {
-    const res = await fetch("http://localhost:8000/api/resume/analyze", {
+    // Server-Sent Events over a POST body, so read the stream by hand instead of using EventSource
+    const res = await fetch("http://localhost:8000/api/resume/analyze/stream", {
       method: "POST",
       headers: {
         "Content-Type": "application/json"
@@ -17,23 +35,52 @@ async function analyze() {
       body: JSON.stringify({ resume_text: resume, job_description: jd })
     });
 
-    const data = await res.json();
-
-    if (Array.isArray(data.suggestions)) {
-      document.getElementById("result").innerHTML = `
-        <h3>Match Score: ${data.match_score}%</h3>
-        <ul>${data.suggestions.map(s => `<li>${s}</li>`).join('')}</ul>
-      `;
-    } else {
-      document.getElementById("result").innerHTML = `
-        <h3>Match Score: ${data.match_score}%</h3>
-        <p>${(data.suggestions || []).join("<br>")}</p>
-      `;
+    if (!res.ok || !res.body) {
+      throw new Error(`Unexpected response: ${res.status}`);
     }
 
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      let boundary;
+      while ((boundary = buffer.indexOf("\n\n")) !== -1) {
+        const raw = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+        handleAnalysisEvent(raw);
+      }
+    }
   } catch (err) {
     console.error("Analyze failed:", err);
-    document.getElementById("result").innerText = "An error occurred during analysis.";
+    resultEl.innerText = "An error occurred during analysis.";
+  }
+}
+
+function handleAnalysisEvent(raw) {
+  let event = "message";
+  let data = "";
+  raw.split("\n").forEach(line => {
+    if (line.startsWith("event:")) event = line.slice(6).trim();
+    else if (line.startsWith("data:")) data += line.slice(5).trim();
+  });
+  if (!data) return;
+  const payload = JSON.parse(data);
+
+  if (event === "token") {
+    const streamEl = document.getElementById("analysisStream");
+    if (streamEl) streamEl.textContent += payload.text;
+  } else if (event === "match_score") {
+    const heading = document.querySelector("#result h3");
+    if (heading) heading.textContent = `Match Score: ${payload.match_score}%`;
+  } else if (event === "result") {
+    renderAnalysis(payload);
+  } else if (event === "error") {
+    document.getElementById("result").innerText = `An error occurred during analysis: ${payload.detail}`;
   }
 }
 
@@ -72,43 +119,95 @@ async function uploadResume() {
 }
 
 // === Load Application Dashboard ===
-async function loadDashboard() {
+const statuses = ["Applied", "Interview", "Rejected"];
+let dashboardApps = [];
+let dashboardCursor = null;
+
+// Company and role are free text typed by users, so escape them before building markup
+function escapeHTML(value) {
+  return String(value).replace(/[&<>"']/g, ch => ({
+    "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"
+  })[ch]);
+}
+
+function renderDashboard(counts) {
+  const grouped = { Applied: [], Interview: [], Rejected: [] };
+  dashboardApps.forEach(app => {
+    if (grouped[app.status]) {
+      grouped[app.status].push(app);
+    }
+  });
+
+  const container = document.getElementById("dashboard");
+  container.innerHTML = statuses.map(status => `
+    <div class="column"
+         ondragover="event.preventDefault()"
+         ondrop="handleDrop(event, '${status}')">
+      <h3>${status} (${counts[status] || 0})</h3>
+      ${grouped[status].map(app => `
+        <div class="app-card"
+             draggable="true"
+             ondragstart="handleDragStart(event, ${app.id})">
+          <strong>${escapeHTML(app.company)}</strong><br />
+          <span>${escapeHTML(app.role)}</span><br />
+          <label>Status:</label>
+          <select onchange="updateStatus(${app.id}, this.value)">
+            ${statuses.map(s => `<option value="${s}" ${s === app.status ? "selected" : ""}>${s}</option>`).join('')}
+          </select>
+        </div>
+      `).join('')}
+    </div>
+  `).join('');
+  document.getElementById("dashboardMore").hidden = !dashboardCursor;
+}
+
+async function loadDashboard(more = false) {
+  const email = document.getElementById("dashboardEmail").value;
+  if (!email) {
+    document.getElementById("dashboard").innerText = "Enter your email to load your applications.";
+    return;
+  }
+
+  const params = new URLSearchParams({ user_email: email });
+  const status = document.getElementById("dashboardStatus").value;
+  const company = document.getElementById("dashboardCompany").value;
+  if (status) params.set("status", status);
+  if (company) params.set("company", company);
+  if (more && dashboardCursor) params.set("cursor", dashboardCursor);
+
   try {
-    const res = await fetch("http://localhost:8000/api/dashboard");
+    const res = await fetch(`http://localhost:8000/api/dashboard?${params}`);
     const data = await res.json();
 
-    const statuses = ["Applied", "Interview", "Rejected"];
-    const grouped = { Applied: [], Interview: [], Rejected: [] };
+    dashboardApps = more ? dashboardApps.concat(data.applications) : data.applications;
+    dashboardCursor = data.next_cursor;
+    renderDashboard(data.counts);
+  } catch (err) {
+    console.error("Failed to load dashboard:", err);
+    document.getElementById("dashboard").innerText = "Failed to load dashboard.";
+  }
+}
+
+// === Add an Application ===
+async function addApplication() {
+  const user_email = document.getElementById("dashboardEmail").value;
+  const company = document.getElementById("newCompany").value;
+  const role = document.getElementById("newRole").value;
+  if (!user_email || !company || !role) {
+    alert("Please enter your email, a company and a role.");
+    return;
+  }
 
-    data.applications.forEach(app => {
-      if (grouped[app.status]) {
-        grouped[app.status].push(app);
-      }
+  try {
+    await fetch("http://localhost:8000/api/dashboard/applications", {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ user_email, company, role })
     });
 
-    const container = document.getElementById("dashboard");
-    container.innerHTML = statuses.map(status => `
-      <div class="column"
-           ondragover="event.preventDefault()"
-           ondrop="handleDrop(event, '${status}')">
-        <h3>${status}</h3>
-        ${grouped[status].map(app => `
-          <div class="app-card"
-               draggable="true"
-               ondragstart="handleDragStart(event, ${app.id})">
-            <strong>${app.company}</strong><br />
-            <span>${app.role}</span><br />
-            <label>Status:</label>
-            <select onchange="updateStatus(${app.id}, this.value)">
-              ${statuses.map(s => `<option value="${s}" ${s === app.status ? "selected" : ""}>${s}</option>`).join('')}
-            </select>
-          </div>
-        `).join('')}
-      </div>
-    `).join('');
+    loadDashboard(); // Refresh dashboard
   } catch (err) {
-    console.error("Failed to load dashboard:", err);
-    document.getElementById("dashboard").innerText = "Failed to load dashboard.";
+    console.error("Failed to add application:", err);
   }
 }
 
@@ -0,0 +1,50 @@
+import argparse
+import asyncio
+import sys
+
+from database import database
+from backend.ingest import ResumeIngestor
+
+
+def print_progress(progress):
+    done = progress.parsed + progress.failed
+    sys.stdout.write(
+        f"\r{done}/{progress.total} files, {progress.failed} failed, "
+        f"{progress.profiles_upserted} profiles, {progress.parsed / max(progress.elapsed, 1e-9):.1f} resumes/s"
+    )
+    sys.stdout.flush()
+
+
+async def main(args):
+    ingestor = ResumeIngestor(
+        None if args.dry_run else database,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        max_pages=args.max_pages
+    )
+    if not args.dry_run:
+        await database.connect()
+    try:
+        progress = await ingestor.ingest(args.path, on_progress=print_progress)
+    finally:
+        ingestor.shutdown()
+        if not args.dry_run:
+            await database.disconnect()
+
+    print()
+    for error in progress.errors:
+        print(f"  {error['filename']}: {error['error']}")
+    print(
+        f"Ingested {progress.parsed} of {progress.total} resumes in {progress.elapsed:.1f}s "
+        f"({progress.duplicate_resumes} already stored)."
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-load resume PDFs from a directory or zip file.")
+    parser.add_argument("path", help="directory or .zip archive of PDF resumes")
+    parser.add_argument("--workers", type=int, default=None, help="parser processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=200, help="rows per database upsert")
+    parser.add_argument("--max-pages", type=int, default=20)
+    parser.add_argument("--dry-run", action="store_true", help="parse only, write nothing")
+    asyncio.run(main(parser.parse_args()))
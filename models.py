@@ -1,4 +1,4 @@
-from sqlalchemy import Table, Column, Integer, String, Text
+from sqlalchemy import Table, Column, Index, Integer, String, Text, DateTime, func
 from database import metadata
 
 # User profiles table
@@ -20,4 +20,35 @@ resumes = Table(
     Column("id", Integer, primary_key=True),
     Column("filename", String, nullable=False),
     Column("content", Text, nullable=False),
+    # SHA-256 of content, so ingesting the same resume again does not add another row
+    Column("content_hash", String(64), nullable=True, unique=True),
+)
+
+# Persistent tier of the resume analysis cache, keyed by a hash of the inputs.
+# Expired rows are pruned by created_at.
+analysis_cache = Table(
+    "analysis_cache",
+    metadata,
+    Column("key", String(64), primary_key=True),
+    Column("model", String, nullable=True),
+    Column("result", Text, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Index("ix_analysis_cache_created_at", "created_at"),
+)
+
+# Job applications shown on the tracker dashboard. Pages are read newest first per user,
+# optionally filtered by status or company, so the indexes lead with user_email.
+applications = Table(
+    "applications",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("user_email", String, nullable=False),
+    Column("company", String, nullable=False),
+    Column("role", String, nullable=False),
+    Column("status", String, nullable=False, server_default="Applied"),
+    Column("created_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Index("ix_applications_user_status_updated", "user_email", "status", "updated_at", "id"),
+    Index("ix_applications_user_updated", "user_email", "updated_at", "id"),
+    Index("ix_applications_user_company_updated", "user_email", "company", "updated_at", "id"),
 )
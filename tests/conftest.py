@@ -0,0 +1,4 @@
+import os
+
+# database.py builds its Database object at import; the unit tests never connect to it
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/test")
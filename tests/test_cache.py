@@ -0,0 +1,331 @@
+import asyncio
+
+import pytest
+
+import httpx
+
+import backend.main as main
+from backend.cache import AnalysisCache, LRUCache, ProfileCache, SharedCacheBackend
+from backend.llm import LLMGateway
+from bench import fake_llm
+
+
+class Row:
+    def __init__(self, mapping: dict):
+        self._mapping = mapping
+
+
+class FakeDatabase:
+    """Answers ProfileCache's profile lookups from a dict; set ``gate`` to hold lookups open."""
+
+    def __init__(self, profiles: dict):
+        self.profiles = profiles
+        self.queries = 0
+        self.gate = None
+
+    async def fetch_one(self, query):
+        self.queries += 1
+        (email,) = query.compile().params.values()
+        profile = self.profiles.get(email)
+        if self.gate is not None:
+            await self.gate.wait()
+        return Row(dict(profile)) if profile else None
+
+
+class BrokenBackend(SharedCacheBackend):
+    async def get(self, key):
+        raise ConnectionError("redis is down")
+
+    async def set(self, key, value, ttl):
+        raise ConnectionError("redis is down")
+
+    async def delete(self, key):
+        raise ConnectionError("redis is down")
+
+
+def profile(email: str, name: str = "Old Name"):
+    return {"email": email, "full_name": name}
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def started(task):
+    # Lets the task run until it blocks on the database gate
+    for _ in range(5):
+        await asyncio.sleep(0)
+    return task
+
+
+def test_load_racing_an_invalidation_is_not_cached():
+    async def scenario():
+        database = FakeDatabase({"a@x.com": profile("a@x.com")})
+        cache = ProfileCache(database)
+        database.gate = asyncio.Event()
+        load = await started(asyncio.ensure_future(cache.get("a@x.com")))
+
+        database.profiles["a@x.com"] = profile("a@x.com", "New Name")
+        await cache.invalidate("a@x.com")
+        database.gate.set()
+        assert (await load)["full_name"] == "Old Name"
+        assert cache.memory.get("a@x.com") is None
+
+        database.gate = None
+        assert (await cache.get("a@x.com"))["full_name"] == "New Name"
+        assert cache.memory.get("a@x.com")["full_name"] == "New Name"
+
+    run(scenario())
+
+
+def test_invalidating_another_email_does_not_block_caching():
+    async def scenario():
+        database = FakeDatabase({"a@x.com": profile("a@x.com")})
+        cache = ProfileCache(database)
+        database.gate = asyncio.Event()
+        load = await started(asyncio.ensure_future(cache.get("a@x.com")))
+        await cache.invalidate("b@x.com")
+        database.gate.set()
+        await load
+        assert cache.memory.get("a@x.com") is not None
+
+    run(scenario())
+
+
+def test_concurrent_misses_share_one_query():
+    async def scenario():
+        database = FakeDatabase({"a@x.com": profile("a@x.com")})
+        cache = ProfileCache(database)
+        database.gate = asyncio.Event()
+        loads = [asyncio.ensure_future(cache.get("a@x.com")) for _ in range(10)]
+        await started(loads[0])
+        database.gate.set()
+        results = await asyncio.gather(*loads)
+        assert database.queries == 1
+        assert all(result == profile("a@x.com") for result in results)
+        assert cache.loads.stats()["shared"] == 9
+
+    run(scenario())
+
+
+def test_evicted_generation_cannot_make_a_stale_load_look_current():
+    async def scenario():
+        database = FakeDatabase({"a@x.com": profile("a@x.com")})
+        cache = ProfileCache(database, max_entries=2)
+        database.gate = asyncio.Event()
+        load = await started(asyncio.ensure_future(cache.get("a@x.com")))
+
+        await cache.invalidate("a@x.com")
+        # Push a@x.com out of the bounded generation map
+        for email in ("b@x.com", "c@x.com", "d@x.com"):
+            await cache.invalidate(email)
+        assert "a@x.com" not in cache._generations
+
+        database.gate.set()
+        await load
+        assert cache.memory.get("a@x.com") is None
+
+        # A load that starts after the eviction is cached as usual
+        database.gate = None
+        await cache.get("a@x.com")
+        assert cache.memory.get("a@x.com") is not None
+
+    run(scenario())
+
+
+def test_missing_profile_is_not_cached():
+    async def scenario():
+        database = FakeDatabase({})
+        cache = ProfileCache(database)
+        assert await cache.get("nobody@x.com") is None
+        assert await cache.get("nobody@x.com") is None
+        assert database.queries == 2
+
+    run(scenario())
+
+
+def test_shared_backend_errors_fall_through_to_the_database():
+    async def scenario():
+        database = FakeDatabase({"a@x.com": profile("a@x.com")})
+        cache = ProfileCache(database, shared=BrokenBackend())
+        assert await cache.get("a@x.com") == profile("a@x.com")
+        # The failed shared get and the failed shared set
+        assert cache.shared_errors == 2
+        assert cache.db_loads == 1
+        await cache.invalidate("a@x.com")
+        assert cache.shared_errors == 3
+
+    run(scenario())
+
+
+def test_shared_backend_must_implement_every_method():
+    class Partial(SharedCacheBackend):
+        async def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("backend.cache.time.monotonic", clock)
+    return clock
+
+
+def test_lru_expires_entries_after_the_ttl(clock):
+    lru = LRUCache(max_entries=4, ttl=10)
+    lru.set("a", 1)
+    clock.now += 9.9
+    assert lru.get("a") == 1
+    clock.now += 0.1
+    assert lru.get("a") is None
+    assert len(lru) == 0
+    assert lru.stats() == {
+        "size": 0, "max_entries": 4, "ttl": 10, "hits": 1, "misses": 1, "evictions": 0, "expirations": 1,
+    }
+
+
+def test_lru_set_restarts_the_ttl(clock):
+    lru = LRUCache(max_entries=4, ttl=10)
+    lru.set("a", 1)
+    clock.now += 8
+    lru.set("a", 2)
+    clock.now += 8
+    assert lru.get("a") == 2
+
+
+def test_lru_evicts_the_least_recently_used_entry(clock):
+    lru = LRUCache(max_entries=2, ttl=10)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == 1
+    lru.set("c", 3)
+    assert lru.get("b") is None
+    assert lru.get("a") == 1
+    assert lru.get("c") == 3
+    stats = lru.stats()
+    assert (stats["size"], stats["evictions"], stats["expirations"], stats["misses"]) == (2, 1, 0, 1)
+
+
+def test_lru_with_no_room_stores_nothing():
+    lru = LRUCache(max_entries=0)
+    lru.set("a", 1)
+    assert lru.get("a") is None
+    assert lru.stats()["evictions"] == 0
+
+
+class AnalysisDatabase:
+    """Records the statements AnalysisCache sends; every lookup misses."""
+
+    def __init__(self, fail: bool = False):
+        self.statements = []
+        self.fail = fail
+
+    async def fetch_one(self, query):
+        if self.fail:
+            raise ConnectionError("database is down")
+        return None
+
+    async def execute(self, query):
+        self.statements.append(query)
+        if self.fail:
+            raise ConnectionError("database is down")
+
+
+def deletes(database):
+    return [statement for statement in database.statements if statement.is_delete]
+
+
+def test_analysis_cache_prunes_expired_rows_on_write():
+    async def scenario():
+        database = AnalysisDatabase()
+        cache = AnalysisCache(database, ttl=60, persist=True, prune_interval=3600)
+        await cache.set("k1", {"match_score": 1})
+        await cache.set("k2", {"match_score": 2})
+        (delete,) = deletes(database)
+        params = delete.compile().params
+        assert list(params) == ["created_at_1"]
+        assert "created_at <" in str(delete)
+        assert cache.stats()["prunes"] == 1
+
+        cache._pruned_at -= 3600
+        await cache.set("k3", {"match_score": 3})
+        assert len(deletes(database)) == 2
+
+    run(scenario())
+
+
+def test_analysis_cache_without_persist_never_touches_the_database():
+    async def scenario():
+        database = AnalysisDatabase()
+        cache = AnalysisCache(database)
+        await cache.set("k", {"match_score": 1})
+        assert await cache.get("k") == {"match_score": 1}
+        assert await cache.get("other") is None
+        assert database.statements == []
+        assert (cache.memory_hits, cache.misses, cache.stores) == (1, 1, 1)
+
+    run(scenario())
+
+
+def test_analysis_cache_database_errors_are_counted_not_raised():
+    async def scenario():
+        cache = AnalysisCache(AnalysisDatabase(fail=True), persist=True)
+        await cache.set("k", {"match_score": 1})
+        cache.memory.clear()
+        assert await cache.get("k") is None
+        # The upsert, the prune and the lookup
+        assert cache.db_errors == 3
+        assert cache.prunes == 0
+
+    run(scenario())
+
+
+@pytest.fixture
+def analysis(monkeypatch):
+    fake_llm.config.update(latency=0, error_rate=0, token_rate=0)
+    fake_llm.stats.update(requests=0, in_flight=0, max_in_flight=0)
+    llm = LLMGateway("http://fake/models", api_key=None, model="m", transport=httpx.ASGITransport(app=fake_llm.app))
+    monkeypatch.setattr(main, "llm", llm)
+    monkeypatch.setattr(main, "result_cache", AnalysisCache(None))
+    return main.result_cache
+
+
+def test_bypass_cache_calls_the_llm_and_refreshes_the_entry(analysis):
+    async def scenario():
+        first = await main.run_analysis("resume", "job")
+        assert await main.run_analysis("resume", "job") == first
+        assert fake_llm.stats["requests"] == 1
+
+        await main.run_analysis("resume", "job", bypass_cache=True)
+        assert fake_llm.stats["requests"] == 2
+        await main.llm.aclose()
+
+    run(scenario())
+    assert (analysis.memory_hits, analysis.misses, analysis.bypasses, analysis.stores) == (1, 1, 1, 2)
+
+
+def test_bypass_cache_applies_to_every_job_in_a_batch(analysis):
+    async def scenario():
+        await main.score_job_descriptions("resume", ["job a", "job b"])
+        requests = fake_llm.stats["requests"]
+        await main.score_job_descriptions("resume", ["job a", "job b"])
+        assert fake_llm.stats["requests"] == requests
+
+        await main.score_job_descriptions("resume", ["job a", "job b"], bypass_cache=True)
+        assert fake_llm.stats["requests"] > requests
+        await main.llm.aclose()
+
+    run(scenario())
+    assert analysis.bypasses == 1
+    assert analysis.memory_hits == 2
@@ -0,0 +1,83 @@
+import time
+
+import pytest
+
+from backend.json_extract import JSONStreamExtractor, extract_json
+
+ANSWER = {"match_score": 80, "suggestions": ["a"]}
+ANSWER_TEXT = '{"match_score": 80, "suggestions": ["a"]}'
+
+
+def streamed(text: str, chunk_size: int = 3):
+    extractor = JSONStreamExtractor()
+    for start in range(0, len(text), chunk_size):
+        extractor.feed(text[start:start + chunk_size])
+    return extractor.close()
+
+
+@pytest.mark.parametrize("text", [
+    ANSWER_TEXT,
+    "Here you go:\n" + ANSWER_TEXT + "\nThanks!",
+    "<think>maybe {\"match_score\": 10</think>\n" + ANSWER_TEXT,
+    # A quoted bracket before the answer flips quote parity
+    'He said "hi {" then ' + ANSWER_TEXT,
+    # An unclosed quote inside an unclosed bracket
+    'score is {roughly "80 ... Final: ' + ANSWER_TEXT,
+    # A mismatched bracket after a quote
+    'x {a "b] c} ' + ANSWER_TEXT,
+    # A non-JSON span with quotes that closes before the answer
+    'They wrote {"built" tools} and then ' + ANSWER_TEXT,
+])
+def test_finds_answer(text):
+    assert extract_json(text) == ANSWER
+    assert streamed(text) == ANSWER
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "no json here",
+    'nothing "here {',
+    '{"match_score": "high", "suggestions": []}',
+    '{"match_score": true, "suggestions": []}',
+])
+def test_returns_none_without_a_matching_object(text):
+    assert extract_json(text) is None
+    assert streamed(text) is None
+
+
+def test_skips_objects_that_do_not_match_the_schema():
+    text = '{"note": "draft"} then ' + ANSWER_TEXT
+    assert extract_json(text) == ANSWER
+
+
+def test_finds_answer_nested_in_prose_braces():
+    assert extract_json("{ result: " + ANSWER_TEXT + " }") == ANSWER
+
+
+def test_array_mode():
+    text = 'Scores: [{"job": 1, "match_score": 70, "suggestions": []}, {"job": 2, "match_score": 60, "suggestions": []}]'
+    assert extract_json(text, schema=None, array=True) == [
+        {"job": 1, "match_score": 70, "suggestions": []},
+        {"job": 2, "match_score": 60, "suggestions": []},
+    ]
+
+
+def best_time(text: str, repeat: int = 3):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        assert extract_json(text) is None
+        assert streamed(text, chunk_size=64) is None
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+@pytest.mark.parametrize("unit", [
+    "if (a) { b = c[0]; ",
+    '{ "',
+    'map {"a": 1, "b" and\n',
+])
+def test_time_is_linear_in_unclosed_brackets(unit):
+    # Quadratic work would take 16x as long for 4x the input; allow plenty of noise around 4x
+    small, large = best_time(unit * 1000), best_time(unit * 4000)
+    assert large < small * 8
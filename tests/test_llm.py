@@ -0,0 +1,150 @@
+import asyncio
+
+import httpx
+import pytest
+
+from backend.llm import LLMError, LLMGateway
+from bench import fake_llm
+
+
+class TimeoutTransport(httpx.ASGITransport):
+    """ASGITransport ignores timeouts; enforce the read timeout the way a network transport would."""
+
+    async def handle_async_request(self, request):
+        try:
+            return await asyncio.wait_for(super().handle_async_request(request), request.extensions["timeout"]["read"])
+        except asyncio.TimeoutError:
+            raise httpx.ReadTimeout("timed out", request=request)
+
+
+@pytest.fixture(autouse=True)
+def fake_server():
+    saved = dict(fake_llm.config)
+    fake_llm.config.update(latency=0, error_rate=0, token_rate=0, retry_after="0")
+    fake_llm.script.clear()
+    fake_llm.stats.update(requests=0, in_flight=0, max_in_flight=0)
+    yield
+    fake_llm.config.update(saved)
+    fake_llm.script.clear()
+
+
+def gateway(**kwargs):
+    options = {"max_retries": 2, "backoff_base": 0.001, "transport": TimeoutTransport(app=fake_llm.app)}
+    return LLMGateway("http://fake/models", api_key=None, model="m", **{**options, **kwargs})
+
+
+def run(coroutine_fn, llm):
+    async def main():
+        try:
+            return await coroutine_fn()
+        finally:
+            await llm.aclose()
+    return asyncio.run(main())
+
+
+def test_complete_returns_the_message_content():
+    llm = gateway()
+    assert '"match_score": 72' in run(lambda: llm.complete("hi"), llm)
+
+
+@pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+def test_retries_rate_limits_and_server_errors(status):
+    fake_llm.script.extend([status, status])
+    llm = gateway()
+    assert run(lambda: llm.complete("hi"), llm)
+    assert fake_llm.stats["requests"] == 3
+
+
+def test_gives_up_after_max_retries():
+    fake_llm.script.extend([503] * 3)
+    llm = gateway()
+    with pytest.raises(LLMError) as error:
+        run(lambda: llm.complete("hi"), llm)
+    assert error.value.status_code == 503
+    assert fake_llm.stats["requests"] == 3
+
+
+def test_honors_retry_after():
+    fake_llm.config["retry_after"] = "0.2"
+    fake_llm.script.append(429)
+    # Jittered backoff alone would wait at most a millisecond
+    llm = gateway()
+    waits = []
+    backoff = llm._backoff
+
+    def recorded_backoff(attempt, retry_after=None):
+        waits.append(backoff(attempt, retry_after))
+        return waits[-1]
+
+    llm._backoff = recorded_backoff
+    assert run(lambda: llm.complete("hi"), llm)
+    assert waits == [0.2]
+
+
+@pytest.mark.parametrize("status", [400, 401, 404, 422])
+def test_does_not_retry_other_client_errors(status):
+    fake_llm.script.append(status)
+    llm = gateway()
+    with pytest.raises(LLMError) as error:
+        run(lambda: llm.complete("hi"), llm)
+    assert error.value.status_code == status
+    assert fake_llm.stats["requests"] == 1
+
+
+def test_timeout_is_an_llm_error():
+    fake_llm.config["latency"] = 1
+    llm = gateway(max_retries=0)
+    with pytest.raises(LLMError, match="timed out"):
+        run(lambda: llm.complete("hi", timeout=0.05), llm)
+
+
+def test_non_json_success_is_an_llm_error():
+    fake_llm.script.append("malformed")
+    llm = gateway()
+    with pytest.raises(LLMError, match="Malformed chat completion response"):
+        run(lambda: llm.complete("hi"), llm)
+    assert fake_llm.stats["requests"] == 1
+
+
+def test_caps_in_flight_calls_at_max_concurrency():
+    fake_llm.config["latency"] = 0.02
+    llm = gateway(max_concurrency=3)
+
+    async def many():
+        return await asyncio.gather(*[llm.complete(f"prompt {n}") for n in range(12)])
+
+    assert len(run(many, llm)) == 12
+    assert fake_llm.stats["max_in_flight"] == 3
+
+
+def collect(llm):
+    async def stream():
+        return "".join([delta async for delta in llm.stream("hi")])
+    return run(stream, llm)
+
+
+def test_stream_yields_the_deltas():
+    assert collect(gateway()) == fake_llm.reply_text("hi")
+
+
+def test_stream_retries_before_the_first_delta():
+    fake_llm.script.extend([429, 502])
+    assert collect(gateway()) == fake_llm.reply_text("hi")
+    assert fake_llm.stats["requests"] == 3
+
+
+def test_stream_does_not_retry_after_the_first_delta():
+    fake_llm.script.append("bad_chunk")
+    with pytest.raises(LLMError, match="Malformed chat completion stream"):
+        collect(gateway())
+    assert fake_llm.stats["requests"] == 1
+
+
+@pytest.mark.parametrize("payload", ["[1, 2]", "42", '"text"', '{"choices": {"delta": 1}}'])
+def test_stream_rejects_chunks_that_are_not_objects(payload):
+    with pytest.raises(ValueError):
+        gateway()._stream_deltas(payload)
+
+
+def test_stream_skips_choices_without_content():
+    assert gateway()._stream_deltas('{"choices": [1, {"delta": null}, {"delta": {"content": "ok"}}]}') == ["ok"]
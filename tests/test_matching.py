@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from backend.matching import TfidfIndex, rank_documents, term_frequencies
+
+DOCUMENTS = {
+    "python": "Senior Python developer, Django and PostgreSQL, built REST APIs",
+    "frontend": "Frontend engineer: React, TypeScript, CSS and accessibility",
+    "data": "Data engineer with Python, Spark and Airflow pipelines on PostgreSQL",
+    "nurse": "Registered nurse, intensive care unit, patient triage",
+}
+
+
+def dense_scores(documents, query, n_features=256):
+    tf = np.array([term_frequencies(text, n_features) for text in documents.values()])
+    idf = np.log((1 + len(tf)) / (1 + (tf > 0).sum(axis=0))) + 1
+    weighted = tf * idf
+    query = term_frequencies(query, n_features) * idf
+    scores = weighted @ query / (np.linalg.norm(weighted, axis=1) * np.linalg.norm(query))
+    return dict(zip(documents, scores))
+
+
+def build(documents, n_features=256, **kwargs):
+    index = TfidfIndex(n_features, initial_capacity=1, **kwargs)
+    for key, text in documents.items():
+        index.add(key, text)
+    return index
+
+
+def test_scores_match_dense_tfidf():
+    query = "Python engineer for PostgreSQL data pipelines"
+    expected = dense_scores(DOCUMENTS, query)
+    results = build(DOCUMENTS).search(query, top_k=10)
+    assert [key for key, _ in results] == sorted(
+        (key for key in expected if expected[key] > 0), key=lambda key: -expected[key]
+    )
+    for key, score in results:
+        assert score == pytest.approx(expected[key], rel=1e-5)
+
+
+def test_replacing_a_document_updates_frequencies_and_compacts():
+    index = build(DOCUMENTS)
+    for _ in range(5):
+        index.add("nurse", "Nurse turned Python developer, Django and React")
+    documents = {**DOCUMENTS, "nurse": "Nurse turned Python developer, Django and React"}
+    assert len(index) == len(documents)
+    assert index.stats()["entries"] == index._size
+
+    query = "Django developer"
+    expected = dense_scores(documents, query)
+    for key, score in index.search(query, top_k=10):
+        assert score == pytest.approx(expected[key], rel=1e-5)
+
+
+def test_norms_of_added_rows_use_the_current_weights():
+    index = build(DOCUMENTS, idf_refresh=1.0)
+    index.search("python", top_k=1)
+    index.add("java", "Java developer, Spring Boot and PostgreSQL")
+    key, score = index.search("Java Spring Boot developer", top_k=1)[0]
+    assert key == "java"
+    assert 0 < score <= 1
+
+
+def test_empty_queries_and_index():
+    assert TfidfIndex(64).search("python", top_k=5) == []
+    assert build(DOCUMENTS).search("the and of", top_k=5) == []
+    assert build(DOCUMENTS).search("python", top_k=0) == []
+
+
+def test_rank_documents_returns_positions():
+    ranked = rank_documents("React TypeScript", list(DOCUMENTS.values()), top_k=2, n_features=256)
+    assert ranked[0][0] == list(DOCUMENTS).index("frontend")
@@ -0,0 +1,161 @@
+"""Golden-output tests: backend.resume_parser against the original per-line regex parser.
+
+The reference below is the parser as it was before the single-pass engine.
+The one intended difference is work_history: overlapping context windows
+are merged instead of repeating lines, so the reference applies the same
+merge before comparing.
+"""
+import random
+import re
+
+import pytest
+
+from backend.resume_parser import extract_education, extract_work_experience, parse_resume, split_sections
+from bench.fixtures import make_resume
+
+
+def legacy_split_sections(text: str):
+    pattern = re.compile(
+        r'(education|work experience|professional experience|experience|employment history|skills|projects|certifications|contact information|summary)',
+        re.I
+    )
+    splits = [(m.start(), m.group().lower()) for m in pattern.finditer(text)]
+    sections = {}
+    for i, (start, header) in enumerate(splits):
+        end = splits[i+1][0] if i+1 < len(splits) else len(text)
+        sections[header] = text[start:end].strip()
+    return sections
+
+
+def legacy_extract_contact_info(text: str):
+    email = re.search(r'[\w\.-]+@[\w\.-]+', text)
+    phone = re.search(r'(\+?\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?){1,2}\d{4}', text)
+    return {
+        "email": email.group() if email else None,
+        "phone": phone.group() if phone else None
+    }
+
+
+def legacy_extract_education(text: str):
+    lines = text.split('\n')
+    education_entries = [
+        line.strip() for line in lines
+        if re.search(r'(bachelor|master|ph\.d|degree|university|college)', line, re.I)
+    ]
+    return "\n".join(education_entries)
+
+
+def legacy_extract_work_experience(text: str, merge_windows: bool = False):
+    lines = text.split('\n')
+    keywords = r'(engineer|developer|manager|analyst|consultant|intern|researcher|scientist|technician|designer)'
+    experience_entries = []
+    windows = []
+    for i, line in enumerate(lines):
+        if re.search(keywords, line, re.I):
+            context = "\n".join(lines[max(0, i-1):i+3])
+            experience_entries.append(context.strip())
+            windows.append([max(0, i-1), i+3])
+    if not merge_windows:
+        return "\n\n".join(experience_entries)
+
+    merged = []
+    for low, high in windows:
+        if merged and low < merged[-1][1]:
+            merged[-1][1] = high
+        else:
+            merged.append([low, high])
+    return "\n\n".join("\n".join(lines[low:high]).strip() for low, high in merged)
+
+
+def legacy_extract_name(text: str):
+    lines = text.strip().split("\n")
+    for line in lines[:5]:
+        clean = line.strip()
+        if len(clean.split()) >= 2 and all(w[0].isupper() for w in clean.split() if w[0].isalpha()):
+            return clean
+    return None
+
+
+def legacy_parse_resume(text: str, merge_windows: bool = False):
+    sections = legacy_split_sections(text)
+    contact_info = legacy_extract_contact_info(text)
+    education = legacy_extract_education(sections.get('education', ''))
+    work_history = legacy_extract_work_experience(
+        sections.get('work experience', '') or sections.get('professional experience', '') or sections.get('experience', ''),
+        merge_windows
+    )
+    full_name = legacy_extract_name(text)
+
+    return {
+        "full_name": full_name,
+        "email": contact_info["email"],
+        "phone": contact_info["phone"],
+        "education": education,
+        "work_history": work_history
+    }
+
+
+def noisy_resume(seed: int):
+    """A fixture resume roughed up the way PDF text extraction tends to leave it."""
+    rng = random.Random(seed)
+    text = make_resume(seed, jobs=rng.randint(1, 6))
+    lines = text.split("\n")
+    for _ in range(rng.randint(0, 4)):
+        position = rng.randrange(len(lines))
+        lines[position] = rng.choice([
+            "", "   ", "\t", lines[position] + "  ", "  " + lines[position],
+            lines[position] + " Experience with Python",
+            "Professional Experience", "EDUCATION", "Intern, Skills Lab",
+            "José Álvarez – Senior Engineer", "Université de Montréal, Master’s degree",
+            "• Data Scıentist", "İstanbul Technical Universıty", "ſkills",
+        ])
+    separator = rng.choice(["\n", "\n", "\r\n", "\n\n"])
+    return separator.join(lines) + rng.choice(["", "\n", "  \n\n"])
+
+
+def assert_matches_reference(text: str):
+    assert parse_resume(text) == legacy_parse_resume(text, merge_windows=True)
+    assert split_sections(text) == legacy_split_sections(text)
+    assert extract_education(text) == legacy_extract_education(text)
+    assert extract_work_experience(text) == legacy_extract_work_experience(text, merge_windows=True)
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_matches_reference_on_noisy_corpus(seed):
+    assert_matches_reference(noisy_resume(seed))
+
+
+# Letters that re.I folds onto ASCII: dotted/dotless i, long s and the Kelvin sign
+@pytest.mark.parametrize("line", [
+    "Data Scıentist at Acme",
+    "İstanbul Technical Universıty, Bachelor of Science",
+    "ſkills",
+    "Work Experience",
+    "ſoftware Engineer, ſummary",
+    "\u212aubernetes Consultant",
+    "Senior \u212anowledge Engineer",
+    "\u212aEY SKILLS",
+])
+def test_matches_reference_with_case_folding_letters(line):
+    text = make_resume(1)
+    lines = text.split("\n")
+    for position in (0, 3, len(lines) // 2, len(lines) - 1):
+        assert_matches_reference("\n".join(lines[:position] + [line] + lines[position:]))
+
+
+@pytest.mark.parametrize("text", [
+    make_resume(2).replace("\n", "\r\n"),
+    make_resume(3).replace("\n", "\r\n") + "\r\n",
+    "Jane Doe\r\nEXPERIENCE\r\nSoftware Engineer\r\nAcme\r\n\r\nEDUCATION\r\nMIT, Master of Science\r\n",
+    "",
+    "\n\n",
+    "Experience\nEngineer",
+])
+def test_matches_reference_on_edge_cases(text):
+    assert_matches_reference(text)
+
+
+def test_merges_overlapping_experience_windows():
+    text = "Jane Doe\nExperience\nSoftware Engineer\nData Analyst\nAcme"
+    assert parse_resume(text)["work_history"] == "Experience\nSoftware Engineer\nData Analyst\nAcme"
+    assert legacy_parse_resume(text)["work_history"] != parse_resume(text)["work_history"]